@@ -1,12 +1,16 @@
 """
 Controller for managing annotation operations with warning suppression.
 """
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
 from PyQt5.QtCore import QObject, pyqtSignal
-from PyQt5.QtWidgets import QMessageBox, QColorDialog, QWidget
+from PyQt5.QtWidgets import QMessageBox, QColorDialog, QDialog, QWidget
 from PyQt5.QtGui import QColor
 
-from inkshade.core.annotations import AnnotationManager, Annotation, AnnotationType
+from inkshade.core.annotations import (
+    AnnotationManager, Annotation, AnnotationType, AnnotationLoadWorker
+)
+from inkshade.core.document.pdf_exporter import PDFExporter
 from inkshade.utils.warning_manager import warning_manager, WarningType
 
 
@@ -16,11 +20,90 @@ class AnnotationController(QObject):
     # Signals
     annotations_changed = pyqtSignal()  # Emitted when annotations change
     annotation_selected = pyqtSignal(object)  # Emitted when annotation is selected
+    annotations_loaded = pyqtSignal(int)  # Emitted when a background load completes
     
     def __init__(self, annotation_manager: AnnotationManager, parent: QWidget | None = None):
         super().__init__()
         self.annotation_manager = annotation_manager
         self.parent_widget = parent
+        
+        # Signal batching state (see batch())
+        self._batch_depth = 0
+        self._pending_changed = False
+        
+        # Dialogs are built on first use and reused afterwards
+        self._message_box: Optional[QMessageBox] = None
+        self._color_dialog: Optional[QColorDialog] = None
+        
+        # Background annotation load in progress, if any
+        self._load_worker: Optional[AnnotationLoadWorker] = None
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Coalesce annotations_changed emissions into a single signal.
+        
+        Changes made inside the block are recorded and announced once when
+        the outermost batch exits, so bulk operations trigger one repaint
+        instead of one per annotation. Batches may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_changed:
+                self._pending_changed = False
+                self.annotations_changed.emit()
+    
+    def _show_message(self, title: str, text: str,
+                      icon: QMessageBox.Icon = QMessageBox.Information) -> int:
+        """
+        Show a message using the controller's cached message box.
+        
+        Args:
+            title: Dialog title
+            text: Message text
+            icon: Message box icon
+            
+        Returns:
+            QMessageBox result
+        """
+        if self._message_box is None:
+            self._message_box = QMessageBox(self.parent_widget)
+            self._message_box.setStandardButtons(QMessageBox.Ok)
+        
+        self._message_box.setIcon(icon)
+        self._message_box.setWindowTitle(title)
+        self._message_box.setText(text)
+        return self._message_box.exec_()
+    
+    def _pick_color(self, initial_color: QColor, title: str) -> QColor:
+        """
+        Ask for a color using the controller's cached color dialog.
+        
+        Args:
+            initial_color: Color preselected in the dialog
+            title: Dialog title
+            
+        Returns:
+            The chosen color, or an invalid QColor if the user cancelled
+        """
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self.parent_widget)
+        
+        self._color_dialog.setWindowTitle(title)
+        self._color_dialog.setCurrentColor(initial_color)
+        if self._color_dialog.exec_() == QDialog.Accepted:
+            return self._color_dialog.selectedColor()
+        return QColor()
+    
+    def _emit_changed(self) -> None:
+        """Emit annotations_changed now, or defer it while batching."""
+        if self._batch_depth > 0:
+            self._pending_changed = True
+        else:
+            self.annotations_changed.emit()
     
     def create_text_annotation(self, page_index: int, selected_words: set,
                               annotation_type: AnnotationType, 
@@ -38,8 +121,7 @@ class AnnotationController(QObject):
             True if annotation was created successfully
         """
         if not selected_words:
-            QMessageBox.information(
-                self.parent_widget, 
+            self._show_message(
                 "No Selection", 
                 "Please select text before creating an annotation."
             )
@@ -60,7 +142,7 @@ class AnnotationController(QObject):
         )
         
         self.annotation_manager.add_annotation(annotation)
-        self.annotations_changed.emit()
+        self._emit_changed()
         return True
     
     def create_drawing_annotation(self, page_index: int, 
@@ -96,7 +178,7 @@ class AnnotationController(QObject):
         )
         
         self.annotation_manager.add_annotation(annotation)
-        self.annotations_changed.emit()
+        self._emit_changed()
         return True
     
     def delete_annotation(self, annotation: Annotation) -> bool:
@@ -120,7 +202,7 @@ class AnnotationController(QObject):
         
         if confirmed:
             if self.annotation_manager.remove_annotation(annotation):
-                self.annotations_changed.emit()
+                self._emit_changed()
                 return True
         
         return False
@@ -141,27 +223,17 @@ class AnnotationController(QObject):
             annotation.color[2]
         )
         
-        color = QColorDialog.getColor(
-            initial_color, 
-            self.parent_widget, 
-            "Choose New Color"
-        )
+        color = self._pick_color(initial_color, "Choose New Color")
         
         if color.isValid():
-            # Create updated annotation
-            new_annotation = Annotation(
-                page_index=annotation.page_index,
-                annotation_type=annotation.annotation_type,
-                color=(color.red(), color.green(), color.blue()),
-                quads=annotation.quads,
-                points=annotation.points,
-                stroke_width=annotation.stroke_width,
-                filled=annotation.filled
+            # Only the color changes; the geometry is shared, not copied
+            new_annotation = annotation.with_color(
+                (color.red(), color.green(), color.blue())
             )
             
             # Update in manager
             if self.annotation_manager.update_annotation(annotation, new_annotation):
-                self.annotations_changed.emit()
+                self._emit_changed()
                 return True
         
         return False
@@ -184,7 +256,7 @@ class AnnotationController(QObject):
             True if undo was successful
         """
         if self.annotation_manager.undo():
-            self.annotations_changed.emit()
+            self._emit_changed()
             return True
         return False
     
@@ -196,7 +268,7 @@ class AnnotationController(QObject):
             True if redo was successful
         """
         if self.annotation_manager.redo():
-            self.annotations_changed.emit()
+            self._emit_changed()
             return True
         return False
     
@@ -220,16 +292,20 @@ class AnnotationController(QObject):
             True if save was successful
         """
         if self.annotation_manager.get_annotation_count() == 0:
-            QMessageBox.information(
-                self.parent_widget, 
+            self._show_message(
                 "No Annotations", 
                 "There are no annotations to save."
             )
             return False
         
-        # Export functionality would be handled here
-        # This would integrate with PDFExporter
-        return True
+        # Stream annotations to the exporter one page at a time
+        exporter = PDFExporter()
+        return exporter.export_pages_to_pdf(
+            pdf_path,
+            output_path,
+            self.annotation_manager.iter_annotations_by_page(),
+            self.annotation_manager.get_page_count_with_annotations()
+        )
     
     def load_annotations(self, pdf_path: str) -> int:
         """
@@ -241,15 +317,64 @@ class AnnotationController(QObject):
         Returns:
             Number of annotations loaded
         """
-        self.annotation_manager.set_pdf_path(pdf_path)
-        
-        if self.annotation_manager.auto_load_annotations():
-            count = self.annotation_manager.get_annotation_count()
-            self.annotations_changed.emit()
-            return count
+        with self.batch():
+            self.annotation_manager.set_pdf_path(pdf_path)
+            
+            if self.annotation_manager.auto_load_annotations():
+                self._emit_changed()
+                return self.annotation_manager.get_annotation_count()
         
         return 0
     
+    def load_annotations_async(self, pdf_path: str) -> None:
+        """
+        Load saved annotations for a PDF in the background.
+        
+        The manager is reset for the new PDF right away; annotations appear
+        chunk by chunk as they are parsed, and annotations_loaded is emitted
+        with the total once done. Starting another load (or clearing the
+        manager) discards the results of an earlier one.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        """
+        token = self.annotation_manager.begin_loading(pdf_path)
+        self._emit_changed()
+        
+        if not self.annotation_manager.persistence.has_saved_annotations(pdf_path):
+            self.annotation_manager.finish_loading(token)
+            self.annotations_loaded.emit(0)
+            return
+        
+        worker = AnnotationLoadWorker(self.annotation_manager.persistence, pdf_path)
+        worker.token = token
+        worker.chunk_loaded.connect(
+            lambda chunk, w=worker: self._on_annotation_chunk(w, chunk)
+        )
+        worker.load_finished.connect(
+            lambda success, w=worker: self._on_annotations_load_finished(w, success)
+        )
+        self._load_worker = worker
+        worker.start()
+    
+    def _on_annotation_chunk(self, worker: AnnotationLoadWorker, chunk: list) -> None:
+        """Add a chunk of loaded annotations to the current document."""
+        if self.annotation_manager.append_loaded_annotations(worker.token, chunk):
+            self._emit_changed()
+    
+    def _on_annotations_load_finished(self, worker: AnnotationLoadWorker,
+                                      success: bool) -> None:
+        """Complete a background load and release its worker."""
+        count = self.annotation_manager.finish_loading(worker.token)
+        
+        if worker is self._load_worker:
+            self._load_worker = None
+        worker.wait()
+        worker.deleteLater()
+        
+        if count >= 0:
+            self.annotations_loaded.emit(count if success else 0)
+    
     def check_unsaved_changes(self) -> Optional[int]:
         """
         Check for unsaved changes and prompt user with one-time warning.
@@ -279,28 +404,29 @@ class AnnotationController(QObject):
         Returns:
             List of quad coordinates
         """
-        quads = []
+        # Single pass: fold each word straight into its line's bounds
+        # instead of collecting per-line lists and re-scanning them.
         lines = {}
-        
-        # Group words by line
         for word_info in selected_words:
             line_key = (word_info[5], word_info[6])
-            if line_key not in lines:
-                lines[line_key] = []
-            lines[line_key].append(word_info)
+            bounds = lines.get(line_key)
+            if bounds is None:
+                lines[line_key] = [word_info[0], word_info[1],
+                                   word_info[2], word_info[3]]
+                continue
+            if word_info[0] < bounds[0]:
+                bounds[0] = word_info[0]
+            if word_info[1] < bounds[1]:
+                bounds[1] = word_info[1]
+            if word_info[2] > bounds[2]:
+                bounds[2] = word_info[2]
+            if word_info[3] > bounds[3]:
+                bounds[3] = word_info[3]
         
-        # Create quads for each line
-        for line_key, words_in_line in lines.items():
-            words_in_line.sort(key=lambda x: x[0])
-            
-            min_x = min(word[0] for word in words_in_line)
-            max_x = max(word[2] for word in words_in_line)
-            min_y = min(word[1] for word in words_in_line)
-            max_y = max(word[3] for word in words_in_line)
-            
-            quad = [min_x, min_y, max_x, min_y, 
-                   min_x, max_y, max_x, max_y]
-            quads.append(quad)
+        quads = []
+        for min_x, min_y, max_x, max_y in lines.values():
+            quads.append([min_x, min_y, max_x, min_y,
+                          min_x, max_y, max_x, max_y])
         
         return quads
     
@@ -206,32 +206,35 @@ class UserInputHandler:
         if not label.selected_words:
             return []
 
+        # Single pass per word: track the line's x-extent and the vertical
+        # extent of its leftmost word, without building per-line lists.
         lines_to_highlight = {}
         for word_info in label.selected_words:
             key = (word_info[5], word_info[6])
-            if key not in lines_to_highlight:
-                lines_to_highlight[key] = []
-            lines_to_highlight[key].append(word_info)
-
-        selection_rects = []
-        for line_key, words_in_line in lines_to_highlight.items():
-            if not words_in_line:
+            bounds = lines_to_highlight.get(key)
+            if bounds is None:
+                lines_to_highlight[key] = [
+                    word_info[0],
+                    word_info[2],
+                    word_info[1],
+                    word_info[3],
+                ]
                 continue
-
-            words_in_line.sort(key=lambda x: x[0])
-
-            min_x = min(word[0] for word in words_in_line)
-            max_x = max(word[2] for word in words_in_line)
-
-            first_word_y0 = words_in_line[0][1]
-            first_word_y1 = words_in_line[0][3]
-            line_height = first_word_y1 - first_word_y0
-
+            if word_info[0] < bounds[0]:
+                bounds[0] = word_info[0]
+                bounds[2] = word_info[1]
+                bounds[3] = word_info[3]
+            if word_info[2] > bounds[1]:
+                bounds[1] = word_info[2]
+
+        zoom = label.zoom_level
+        selection_rects = []
+        for min_x, max_x, first_word_y0, first_word_y1 in lines_to_highlight.values():
             line_rect = QRect(
-                int(min_x * label.zoom_level),
-                int(first_word_y0 * label.zoom_level),
-                int((max_x - min_x) * label.zoom_level),
-                int(line_height * label.zoom_level),
+                int(min_x * zoom),
+                int(first_word_y0 * zoom),
+                int((max_x - min_x) * zoom),
+                int((first_word_y1 - first_word_y0) * zoom),
             )
             selection_rects.append(line_rect)
 
@@ -3,17 +3,50 @@ Handles link click actions and navigation.
 """
 from __future__ import annotations
 
-import webbrowser
+import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from PyQt5.QtCore import QObject, pyqtSignal
-from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtCore import QObject, Qt, QTimer, QUrl, pyqtSignal
+from PyQt5.QtGui import QDesktopServices
+from PyQt5.QtWidgets import QApplication, QMessageBox
 
+from inkshade.core.document import DocumentLoadWorker
 from inkshade.core.page.link_layer import LinkInfo, LinkType
 
 if TYPE_CHECKING:
     from inkshade.ui.windows.main_window import MainWindow
 
+logger = logging.getLogger(__name__)
+
+# Prefixes of the schemes we know by name, checked against the lowercased
+# head of a URL (8 characters covers the longest, "https://")
+_PROTOCOL_PREFIXES = (
+    ("https://", "https"),
+    ("http://", "http"),
+    ("mailto:", "mailto"),
+    ("tel:", "tel"),
+)
+_KNOWN_PREFIXES = tuple(prefix for prefix, _ in _PROTOCOL_PREFIXES)
+
+
+@lru_cache(maxsize=4096)
+def _url_protocol(url: str) -> str:
+    """Extract the protocol from a URL, memoized per URL string."""
+    head = url[:8].lower()
+
+    # One C-level multi-prefix test decides whether the scheme is known;
+    # only then is the matching name looked up.
+    if head.startswith(_KNOWN_PREFIXES):
+        for prefix, name in _PROTOCOL_PREFIXES:
+            if head.startswith(prefix):
+                return name
+
+    # Any other scheme is still reported by name so it can be rejected
+    if "://" in url:
+        return url.split("://", 1)[0].lower()
+    return "unknown"
+
 
 class LinkNavigationHandler(QObject):
     """
@@ -37,9 +70,56 @@ class LinkNavigationHandler(QObject):
 
         # Security settings
         self.confirm_external_links = True
-        self.allowed_protocols = {"http", "https", "mailto", "tel"}
+        self.allowed_protocols = frozenset({"http", "https", "mailto", "tel"})
         self.allow_file_launch = False
 
+        # Confirmation box is built on first use and reused afterwards
+        self._message_box: QMessageBox | None = None
+
+        # Link type -> action, built once instead of an if/elif chain per click
+        self._dispatch = {
+            LinkType.GOTO: self._navigate_to_internal,
+            LinkType.GOTO_R: self._navigate_to_remote,
+            LinkType.URI: self._open_external_url,
+            LinkType.NAMED: self._navigate_to_named,
+            LinkType.LAUNCH: self._handle_launch,
+        }
+
+        # Navigation requests are coalesced: a burst of clicks within one
+        # event-loop turn results in a single jump to the last target.
+        self._pending_nav: tuple[int, float] | None = None
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(0)
+        self._nav_timer.timeout.connect(self._flush_navigation)
+
+        # Remote PDF being opened in the background, and the link that
+        # asked for it (to navigate once it is loaded)
+        self._load_worker: DocumentLoadWorker | None = None
+        self._pending_remote_link: LinkInfo | None = None
+        # Superseded workers still running; referenced until they finish so
+        # their QThread is never destroyed while running
+        self._retired_workers: set[DocumentLoadWorker] = set()
+
+    def _ask(
+        self,
+        title: str,
+        text: str,
+        icon: QMessageBox.Icon = QMessageBox.Question,
+        buttons=QMessageBox.Yes | QMessageBox.No,
+        default_button=QMessageBox.No,
+    ) -> int:
+        """Show a message using the handler's cached message box."""
+        if self._message_box is None:
+            self._message_box = QMessageBox(self.main_window)
+
+        self._message_box.setIcon(icon)
+        self._message_box.setWindowTitle(title)
+        self._message_box.setText(text)
+        self._message_box.setStandardButtons(buttons)
+        self._message_box.setDefaultButton(default_button)
+        return self._message_box.exec_()
+
     def handle_link_click(self, link: LinkInfo) -> bool:
         """
         Process a clicked link.
@@ -50,22 +130,8 @@ class LinkNavigationHandler(QObject):
         Returns:
             True if the link was handled successfully
         """
-        if link.link_type == LinkType.GOTO:
-            return self._navigate_to_internal(link)
-
-        elif link.link_type == LinkType.GOTO_R:
-            return self._navigate_to_remote(link)
-
-        elif link.link_type == LinkType.URI:
-            return self._open_external_url(link)
-
-        elif link.link_type == LinkType.NAMED:
-            return self._navigate_to_named(link)
-
-        elif link.link_type == LinkType.LAUNCH:
-            return self._handle_launch(link)
-
-        return False
+        handler = self._dispatch.get(link.link_type)
+        return handler(link) if handler else False
 
     def _navigate_to_internal(self, link: LinkInfo) -> bool:
         """Navigate to an internal page destination."""
@@ -78,16 +144,24 @@ class LinkNavigationHandler(QObject):
         page_num = dest.page_num + 1  # Convert to 1-based
         y_offset = dest.y if dest.y else 0.0
 
-        # Emit signal for navigation
-        self.navigation_requested.emit(page_num, y_offset)
-
-        # Direct navigation if main_window available
-        if self.main_window:
-            self.main_window.page_manager.jump_to_page(page_num, y_offset)
-        else:
-            print("DEBUG: main_window is None!")
+        self._request_navigation(page_num, y_offset)
         return True
 
+    def _request_navigation(self, page_num: int, y_offset: float) -> None:
+        """Queue a navigation; only the latest request per turn is emitted."""
+        self._pending_nav = (page_num, float(y_offset))
+        self._nav_timer.start()
+
+    def _flush_navigation(self) -> None:
+        """Emit the most recent queued navigation request."""
+        if self._pending_nav is None:
+            return
+
+        page_num, y_offset = self._pending_nav
+        self._pending_nav = None
+        logger.debug("Navigating to page %d (y=%.1f)", page_num, y_offset)
+        self.navigation_requested.emit(page_num, y_offset)
+
     def _navigate_to_remote(self, link: LinkInfo) -> bool:
         """Handle links to external PDF files."""
         if not link.file_path:
@@ -96,31 +170,82 @@ class LinkNavigationHandler(QObject):
 
         # Security: Don't automatically open external files
         if self.main_window:
-            reply = QMessageBox.question(
-                self.main_window,
+            reply = self._ask(
                 "Open External PDF",
                 f"This link points to an external file:\n{link.file_path}\n\n"
                 "Do you want to open it?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No,
             )
 
             if reply == QMessageBox.Yes:
-                # Try to open the file
                 import os
 
                 if os.path.exists(link.file_path):
-                    self.main_window.load_pdf(link.file_path)
-
-                    # Navigate to destination if specified
-                    if link.destination:
-                        self._navigate_to_internal(link)
+                    self._load_remote_async(link)
                     return True
                 else:
                     self.link_action_failed.emit(f"File not found: {link.file_path}")
 
         return False
 
+    def _load_remote_async(self, link: LinkInfo) -> None:
+        """Open a remote PDF off the GUI thread, then display it."""
+        # A newer request supersedes one still in flight
+        if self._load_worker is not None:
+            worker = self._load_worker
+            worker.loaded.disconnect()
+            worker.failed.disconnect()
+            self._retired_workers.add(worker)
+            worker.finished.connect(lambda w=worker: self._release_worker(w))
+            if worker.isFinished():
+                self._release_worker(worker)
+            QApplication.restoreOverrideCursor()
+
+        self._pending_remote_link = link
+        self._load_worker = DocumentLoadWorker(link.file_path)
+        self._load_worker.loaded.connect(self._on_remote_loaded)
+        self._load_worker.failed.connect(self._on_remote_failed)
+
+        QApplication.setOverrideCursor(Qt.CursorShape.BusyCursor)
+        self._load_worker.start()
+
+    def _on_remote_loaded(self, file_path: str, doc) -> None:
+        """Display a remote PDF once the worker has opened it."""
+        link = self._pending_remote_link
+        self._finish_remote_load()
+
+        if self.main_window:
+            self.main_window.load_pdf(file_path, doc)
+
+            # Navigate to destination if specified
+            if link is not None and link.destination:
+                self._navigate_to_internal(link)
+        else:
+            doc.close()
+
+    def _on_remote_failed(self, file_path: str, error: str) -> None:
+        """Report a remote PDF that could not be opened."""
+        self._finish_remote_load()
+        self.link_action_failed.emit(f"Failed to open {file_path}: {error}")
+
+    def _finish_remote_load(self) -> None:
+        """Release the load worker and restore the cursor."""
+        QApplication.restoreOverrideCursor()
+        self._pending_remote_link = None
+        if self._load_worker is not None:
+            worker = self._load_worker
+            self._load_worker = None
+            # The result signal is emitted from run(), so the thread may
+            # still be finishing up
+            worker.wait()
+            worker.deleteLater()
+
+    def _release_worker(self, worker: DocumentLoadWorker) -> None:
+        """Delete a superseded load worker once its thread has finished."""
+        if worker in self._retired_workers:
+            self._retired_workers.discard(worker)
+            worker.wait()
+            worker.deleteLater()
+
     def _open_external_url(self, link: LinkInfo) -> bool:
         """Open an external URL in the system browser."""
         url = link.uri
@@ -139,12 +264,9 @@ class LinkNavigationHandler(QObject):
             # Truncate long URLs for display
             display_url = url if len(url) <= 80 else url[:77] + "..."
 
-            reply = QMessageBox.question(
-                self.main_window,
+            reply = self._ask(
                 "Open External Link",
                 f"Open this link in your browser?\n\n{display_url}",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No,
             )
 
             if reply != QMessageBox.Yes:
@@ -152,7 +274,8 @@ class LinkNavigationHandler(QObject):
 
         # Open the URL
         try:
-            webbrowser.open(url)
+            if not QDesktopServices.openUrl(QUrl(url)):
+                raise RuntimeError("no application is registered for this URL")
             self.external_link_opened.emit(url)
             return True
         except Exception as e:
@@ -161,7 +284,7 @@ class LinkNavigationHandler(QObject):
 
     def _navigate_to_named(self, link: LinkInfo) -> bool:
         """Navigate to a named destination."""
-        # If destination was resolved during extraction, use it
+        # Named links are resolved by the link layer when first hit
         if link.destination:
             return self._navigate_to_internal(link)
 
@@ -171,16 +294,17 @@ class LinkNavigationHandler(QObject):
             return False
 
         if self.main_window and self.main_window.pdf_reader.doc:
-            doc = self.main_window.pdf_reader.doc
             try:
-                dest = doc.resolve_link(f"#{link.named_dest}")
+                # Resolved once per document; the reader keeps the result
+                dest = self.main_window.pdf_reader.resolve_named_dest(
+                    link.named_dest
+                )
                 if dest and isinstance(dest, dict):
                     page_num = dest.get("page", 0) + 1
                     to_point = dest.get("to")
                     y_offset = getattr(to_point, "y", 0) if to_point else 0
 
-                    self.navigation_requested.emit(page_num, y_offset)
-                    self.main_window.page_manager.jump_to_page(page_num, y_offset)
+                    self._request_navigation(page_num, y_offset)
                     return True
             except Exception as e:
                 self.link_action_failed.emit(f"Failed to resolve destination: {e}")
@@ -191,35 +315,32 @@ class LinkNavigationHandler(QObject):
         """Handle launch links (opening external applications)."""
         if not self.allow_file_launch:
             if self.main_window:
-                QMessageBox.warning(
-                    self.main_window,
+                self._ask(
                     "Action Blocked",
                     "Opening external applications is disabled for security.\n\n"
                     f"Target: {link.file_path or 'Unknown'}",
+                    icon=QMessageBox.Warning,
+                    buttons=QMessageBox.Ok,
+                    default_button=QMessageBox.Ok,
                 )
             return False
 
         # Even if allowed, require confirmation
         if self.main_window and link.file_path:
-            reply = QMessageBox.warning(
-                self.main_window,
+            reply = self._ask(
                 "Launch Application",
                 f"This link wants to open an external application:\n\n"
                 f"{link.file_path}\n\n"
                 "This could be dangerous. Continue?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No,
+                icon=QMessageBox.Warning,
             )
 
             if reply == QMessageBox.Yes:
-                import os
-                import subprocess
-
                 try:
-                    if os.name == "nt":  # Windows
-                        os.startfile(link.file_path)
-                    elif os.name == "posix":  # macOS/Linux
-                        subprocess.call(["xdg-open", link.file_path])
+                    # Hands off to the platform opener without blocking
+                    target = QUrl.fromLocalFile(link.file_path)
+                    if not QDesktopServices.openUrl(target):
+                        raise RuntimeError("no application is registered for it")
                     return True
                 except Exception as e:
                     self.link_action_failed.emit(f"Failed to launch: {e}")
@@ -228,13 +349,7 @@ class LinkNavigationHandler(QObject):
 
     def _get_url_protocol(self, url: str) -> str:
         """Extract protocol from URL."""
-        if "://" in url:
-            return url.split("://")[0].lower()
-        elif url.startswith("mailto:"):
-            return "mailto"
-        elif url.startswith("tel:"):
-            return "tel"
-        return "unknown"
+        return _url_protocol(url)
 
     def get_link_tooltip(self, link: LinkInfo) -> str:
         """Generate a tooltip string for a link."""
@@ -2,8 +2,9 @@
 Controller for managing PDF view operations and page navigation.
 """
 import fitz  # PyMuPDF
+import time
 from typing import Optional, Dict, Tuple
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QEvent
 from PyQt5.QtWidgets import QScrollArea, QWidget
 
 
@@ -31,8 +32,42 @@ class ViewController(QObject):
         # Loaded pages tracking
         self.loaded_pages: Dict[int, QWidget] = {}
         
+        # Scroll geometry cached for the scroll hot paths: page pitch in
+        # pixels (set_page_height), viewport height (kept current by
+        # eventFilter) and the scroll bar itself
+        self._page_stride: int = 0
+        self._vsb = self.scroll_area.verticalScrollBar()
+        self._viewport_height: int = self.scroll_area.viewport().height()
+        self._viewport_half: float = self._viewport_height / 2
+        self.scroll_area.viewport().installEventFilter(self)
+        
+        # Scroll velocity in pixels per second (positive = downwards), used
+        # to bias prefetching towards the direction of travel
+        self._scroll_velocity: float = 0.0
+        self._last_scroll_value: int = 0
+        self._last_scroll_time: float = 0.0
+        
+        # page_changed is emitted at most once per frame while scrolling.
+        # Scroll values in [_boundary_low, _boundary_high) map to
+        # _pending_page; an empty range forces a recompute.
+        self._pending_page: int = 0
+        self._boundary_low: float = 0.0
+        self._boundary_high: float = 0.0
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._flush_page_changed)
+        
         # Connect scroll events
-        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        self._vsb.valueChanged.connect(self._on_scroll)
+    
+    def eventFilter(self, obj, event) -> bool:
+        """Track viewport resizes so scroll handling never queries them."""
+        if event.type() == QEvent.Resize and obj is self.scroll_area.viewport():
+            self._viewport_height = event.size().height()
+            self._viewport_half = self._viewport_height / 2
+            self._boundary_high = self._boundary_low
+        return False
     
     def set_document_info(self, total_pages: int) -> None:
         """
@@ -44,6 +79,8 @@ class ViewController(QObject):
         self.total_pages = total_pages
         self.current_page = 0
         self.page_height = None
+        self._page_stride = 0
+        self._boundary_high = self._boundary_low
         self.loaded_pages.clear()
     
     def set_page_height(self, height: int) -> None:
@@ -55,6 +92,8 @@ class ViewController(QObject):
         """
         if self.page_height != height:
             self.page_height = height
+            self._page_stride = height + self.page_spacing if height else 0
+            self._boundary_high = self._boundary_low
             self._update_container_height()
     
     def _update_container_height(self) -> None:
@@ -72,26 +111,24 @@ class ViewController(QObject):
         Returns:
             0-based index of the current page
         """
-        if not self.page_height or self.page_height == 0:
+        if not self._page_stride:
             return 0
         
-        vsb = self.scroll_area.verticalScrollBar()
-        scroll_val = vsb.value()
-        viewport_height = self.scroll_area.viewport().height()
-        
         # Calculate which page is in the center of the viewport
-        center_y = scroll_val + viewport_height / 2
-        page_with_spacing = self.page_height + self.page_spacing
-        
-        current = int(center_y / page_with_spacing)
+        center_y = self._vsb.value() + self._viewport_half
+        current = int(center_y // self._page_stride)
         return max(0, min(self.total_pages - 1, current))
     
-    def get_visible_page_range(self, buffer_pages: int = 7) -> Tuple[int, int]:
+    def get_visible_page_range(
+        self, buffer_pages: int = 7, current_page: Optional[int] = None
+    ) -> Tuple[int, int]:
         """
         Get the range of pages that should be loaded.
         
         Args:
             buffer_pages: Number of pages to load above/below visible area
+            current_page: Page to center the range on (defaults to the
+                page under the viewport center)
             
         Returns:
             Tuple of (start_index, end_index) inclusive
@@ -99,9 +136,23 @@ class ViewController(QObject):
         if self.total_pages == 0:
             return 0, 0
         
-        current = self.get_current_page()
-        start = max(0, current - buffer_pages)
-        end = min(self.total_pages - 1, current + buffer_pages)
+        current = self.get_current_page() if current_page is None else current_page
+        before = after = buffer_pages
+        
+        # While scrolling, look further ahead (about a quarter second of
+        # travel, up to three buffers) and keep only half a buffer behind
+        idle = time.monotonic() - self._last_scroll_time > 0.25
+        if not idle and self._scroll_velocity and self._page_stride:
+            ahead = int(abs(self._scroll_velocity) * 0.25 / self._page_stride)
+            lead = max(buffer_pages, min(3 * buffer_pages, ahead))
+            trail = buffer_pages // 2
+            if self._scroll_velocity > 0:
+                before, after = trail, lead
+            else:
+                before, after = lead, trail
+        
+        start = max(0, current - before)
+        end = min(self.total_pages - 1, current + after)
         
         return start, end
     
@@ -113,25 +164,23 @@ class ViewController(QObject):
             page_num: 1-based page number
             y_offset: Optional Y-offset within the page
         """
-        if not self.page_height or self.page_height == 0:
+        if not self._page_stride:
             return
         
         if not (1 <= page_num <= self.total_pages):
             return
         
         # Calculate scroll position
-        page_idx = page_num - 1
-        page_start_y = page_idx * (self.page_height + self.page_spacing)
+        page_start_y = (page_num - 1) * self._page_stride
         
         if y_offset > 0:
             # Apply offset if provided
-            viewport_height = self.scroll_area.viewport().height()
-            target_y = page_start_y + (y_offset * self.zoom_level) - min(50, viewport_height * 0.1)
+            target_y = page_start_y + (y_offset * self.zoom_level) - min(50, self._viewport_height * 0.1)
             target_y = max(0, target_y)
         else:
             target_y = page_start_y
         
-        self.scroll_area.verticalScrollBar().setValue(int(target_y))
+        self._vsb.setValue(int(target_y))
     
     def jump_to_rect(self, page_idx: int, rect: fitz.Rect) -> None:
         """
@@ -148,14 +197,14 @@ class ViewController(QObject):
         viewport_height = self.scroll_area.height()
         rect_center_y = rect.y0 + (rect.height / 2)
         
-        page_y = page_idx * (self.page_height + self.page_spacing)
+        page_y = page_idx * self._page_stride
         rect_y = rect_center_y * self.zoom_level
         
         # Center the rect in viewport
         target_y = page_y + rect_y - (viewport_height / 2)
         target_y = max(0, target_y)
         
-        self.scroll_area.verticalScrollBar().setValue(int(target_y))
+        self._vsb.setValue(int(target_y))
     
     def get_scroll_position(self) -> Tuple[int, int]:
         """
@@ -164,17 +213,10 @@ class ViewController(QObject):
         Returns:
             Tuple of (page_index, offset_in_page)
         """
-        if not self.page_height or self.page_height == 0:
+        if not self._page_stride:
             return 0, 0
         
-        vsb = self.scroll_area.verticalScrollBar()
-        scroll_val = vsb.value()
-        
-        page_with_spacing = self.page_height + self.page_spacing
-        page_idx = int(scroll_val / page_with_spacing)
-        offset = scroll_val % page_with_spacing
-        
-        return page_idx, offset
+        return divmod(self._vsb.value(), self._page_stride)
     
     def restore_scroll_position(self, page_idx: int, offset: int) -> None:
         """
@@ -184,9 +226,9 @@ class ViewController(QObject):
             page_idx: Page index from get_scroll_position
             offset: Offset from get_scroll_position
         """
-        if self.page_height:
-            target_y = (page_idx * (self.page_height + self.page_spacing)) + offset
-            self.scroll_area.verticalScrollBar().setValue(int(target_y))
+        if self._page_stride:
+            target_y = (page_idx * self._page_stride) + offset
+            self._vsb.setValue(int(target_y))
     
     def set_zoom(self, zoom_percent: int) -> None:
         """
@@ -258,11 +300,48 @@ class ViewController(QObject):
         """Clear all loaded pages."""
         self.loaded_pages.clear()
         self.page_height = None
+        self._page_stride = 0
         self.page_container.setMinimumHeight(0)
     
     def _on_scroll(self, value: int) -> None:
-        """Handle scroll events."""
-        new_page = self.get_current_page()
-        if new_page != self.current_page:
-            self.current_page = new_page
-            self.page_changed.emit(new_page)
\ No newline at end of file
+        """
+        Handle scroll events.
+        
+        The page under the viewport center is derived from the scroll value
+        alone; the change notification is deferred to the next frame so a
+        burst of scroll events emits page_changed at most once.
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_scroll_time
+        if 0 < elapsed < 0.25:
+            self._scroll_velocity = (value - self._last_scroll_value) / elapsed
+        else:
+            self._scroll_velocity = 0.0
+        self._last_scroll_value = value
+        self._last_scroll_time = now
+        
+        # Common case: still within the same page
+        if self._boundary_low <= value < self._boundary_high:
+            return
+        
+        stride = self._page_stride
+        if not stride:
+            return
+        
+        new_page = int((value + self._viewport_half) // stride)
+        new_page = max(0, min(self.total_pages - 1, new_page))
+        self._pending_page = new_page
+        
+        # The first and last pages also own everything beyond them
+        low = new_page * stride - self._viewport_half
+        self._boundary_low = low if new_page > 0 else float('-inf')
+        self._boundary_high = low + stride if new_page < self.total_pages - 1 else float('inf')
+        
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+    
+    def _flush_page_changed(self) -> None:
+        """Emit page_changed for the latest scroll position, if it moved."""
+        if self._pending_page != self.current_page:
+            self.current_page = self._pending_page
+            self.page_changed.emit(self._pending_page)
\ No newline at end of file
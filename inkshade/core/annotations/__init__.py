@@ -5,6 +5,7 @@ from .models import Annotation, AnnotationType, ActionType, AnnotationAction
 from .manager import AnnotationManager
 from .undo_redo import UndoRedoStack
 from .persistence import AnnotationPersistence
+from .load_worker import AnnotationLoadWorker
 
 __all__ = [
     'Annotation',
@@ -13,5 +14,6 @@ __all__ = [
     'AnnotationAction',
     'AnnotationManager',
     'UndoRedoStack',
-    'AnnotationPersistence'
+    'AnnotationPersistence',
+    'AnnotationLoadWorker'
 ]
\ No newline at end of file
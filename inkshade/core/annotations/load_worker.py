@@ -0,0 +1,34 @@
+"""
+Background worker for loading saved annotations.
+"""
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from .persistence import AnnotationPersistence
+
+
+class AnnotationLoadWorker(QThread):
+    """Worker thread that parses saved annotations without freezing the UI."""
+    
+    # Signals
+    chunk_loaded = pyqtSignal(list)  # list of Annotation, in file order
+    load_finished = pyqtSignal(bool)  # success
+    
+    # Annotations handed to the UI per signal
+    CHUNK_SIZE = 256
+    
+    def __init__(self, persistence: AnnotationPersistence, pdf_path: str, parent=None):
+        super().__init__(parent)
+        self.persistence = persistence
+        self.pdf_path = pdf_path
+        self.token = 0  # Load session the results belong to (set by the caller)
+    
+    def run(self):
+        """Parse the JSON snapshot and its edit log in the background thread."""
+        annotations, success = self.persistence.load_from_json(self.pdf_path)
+        
+        # Deliver in chunks so the UI thread never ingests everything in
+        # one event and can paint between chunks
+        for start in range(0, len(annotations), self.CHUNK_SIZE):
+            self.chunk_loaded.emit(annotations[start:start + self.CHUNK_SIZE])
+        
+        self.load_finished.emit(success)
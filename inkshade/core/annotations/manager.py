@@ -2,12 +2,104 @@
 Main annotation manager that coordinates all annotation operations.
 Fixed to properly track unsaved changes.
 """
-from typing import List, Optional
-from .models import Annotation, AnnotationType
+import threading
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from PyQt5.QtCore import QCoreApplication, QRunnable, QThreadPool, QTimer
+from .models import ActionType, Annotation, AnnotationAction, AnnotationType
 from .undo_redo import UndoRedoStack
 from .persistence import AnnotationPersistence
 
 
+class _AutoSaveTask(QRunnable):
+    """
+    Writes annotations to disk on a pool thread.
+    
+    Either appends logged edits (entries) or writes a full snapshot (data).
+    Tasks stay owned by Python so the manager can withdraw them from the
+    pool's queue before they start. started is set on the pool thread and
+    read on the GUI thread, so it is an Event rather than a plain flag.
+    """
+    
+    def __init__(self, persistence: AnnotationPersistence, file_path: str,
+                 data: Optional[dict] = None, entries: Optional[List[dict]] = None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.persistence = persistence
+        self.file_path = file_path
+        self.data = data
+        self.entries = entries
+        self.started = threading.Event()
+    
+    def run(self):
+        self.started.set()
+        if self.entries is not None:
+            self.persistence.append_log(self.file_path, self.entries)
+        else:
+            self.persistence.write_json(self.data, self.file_path)
+
+
+class _PageHitIndex:
+    """
+    Packed hit-test boxes for one page's annotations.
+    
+    Boxes live in parallel typed arrays (one row per box) so point queries
+    compare plain doubles instead of walking Annotation objects, and a
+    uniform grid of cell_size PDF points narrows each query to the rows
+    overlapping the point's cell. Rows are added in bucket order, and each
+    cell keeps its rows packed in an array as well.
+    """
+    
+    def __init__(self, page_annotations, zoom: float, cell_size: int):
+        self.cell_size = cell_size
+        self.min_x = array('d')
+        self.min_y = array('d')
+        self.max_x = array('d')
+        self.max_y = array('d')
+        self.owner = array('i')  # Position of the box's annotation in the bucket
+        self.exact = array('b')  # 1 if the box test alone decides a hit
+        self.grid: Dict[Tuple[int, int], array] = {}
+        
+        for pos, ann in enumerate(page_annotations):
+            if ann.annotation_type in (AnnotationType.HIGHLIGHT, AnnotationType.UNDERLINE):
+                for box in ann.quad_bounds:
+                    self._add_box(pos, box, exact=True)
+            elif ann.annotation_type == AnnotationType.FREEHAND and ann.point_bounds:
+                if len(ann.points) < 2:
+                    continue
+                pad = max(ann.stroke_width + 2.0, 5.0) / zoom
+                min_x, min_y, max_x, max_y = ann.point_bounds
+                self._add_box(pos, (min_x - pad, min_y - pad, max_x + pad, max_y + pad),
+                              exact=False)
+            # Other shapes are not hit-testable
+    
+    def _add_box(self, owner: int, box: Tuple[float, float, float, float],
+                 exact: bool) -> None:
+        """Append a box row and register it in every grid cell it overlaps."""
+        row = len(self.owner)
+        min_x, min_y, max_x, max_y = box
+        self.min_x.append(min_x)
+        self.min_y.append(min_y)
+        self.max_x.append(max_x)
+        self.max_y.append(max_y)
+        self.owner.append(owner)
+        self.exact.append(1 if exact else 0)
+        
+        cell = self.cell_size
+        for grid_row in range(int(min_y // cell), int(max_y // cell) + 1):
+            for grid_col in range(int(min_x // cell), int(max_x // cell) + 1):
+                rows = self.grid.get((grid_row, grid_col))
+                if rows is None:
+                    self.grid[(grid_row, grid_col)] = array('i', (row,))
+                else:
+                    rows.append(row)
+    
+    def candidates(self, pdf_x: float, pdf_y: float) -> Sequence[int]:
+        """Get the box rows registered in the grid cell containing a point."""
+        cell = self.cell_size
+        return self.grid.get((int(pdf_y // cell), int(pdf_x // cell)), ())
+
+
 class AnnotationManager:
     """Manages all annotations for a PDF document with undo/redo support."""
     
@@ -23,8 +115,56 @@ class AnnotationManager:
         # For tracking selected annotation
         self.selected_annotation: Optional[Annotation] = None
         
-        # Track the initial state to detect real changes
-        self.initial_annotations: List[Annotation] = []
+        # Per-page buckets (list order preserved) built lazily from
+        # self.annotations, plus per-page hit-test grids keyed by zoom.
+        # Cells are _grid_size PDF points wide.
+        self._by_page: Optional[Dict[int, List[Annotation]]] = None
+        self._page_grids: Dict[int, Tuple[float, _PageHitIndex]] = {}
+        self._grid_size = 32
+        
+        # id(annotation) -> position in self.annotations, built lazily so
+        # remove/update find their target without comparing geometry
+        self._positions: Optional[Dict[int, int]] = None
+        
+        # Pages whose annotations changed since take_changed_pages();
+        # None after bulk changes, meaning every page
+        self._changed_pages: Optional[Set[int]] = None
+        
+        # Change detection: (count, sum of annotation hashes) of the list,
+        # kept up to date edit by edit (None = recompute), and the same
+        # pair for the last saved or loaded state. The sum ignores order,
+        # so undoing back to the saved contents reads as unchanged.
+        self._content_hash: Optional[int] = 0
+        self._saved_state: Tuple[int, int] = (0, 0)
+        
+        # Auto-save is debounced: edits restart the timer and the JSON is
+        # written once things have been quiet for a moment. Writes run on a
+        # single-thread pool so they land on disk in order.
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._do_save_async)
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
+        # Tasks handed to the pool that may not have started yet
+        self._queued_saves: List[_AutoSaveTask] = []
+        
+        # Edits since the last write, as persistence log entries
+        self._pending_log: List[dict] = []
+        # Set when edits could not be expressed as log entries
+        self._force_snapshot = False
+        
+        # Background load session (see begin_loading). Loaded chunks are
+        # inserted ahead of anything the user adds while loading, at
+        # _load_pos; undo/redo are unavailable until loading finishes.
+        self._load_token = 0
+        self._loading = False
+        self._load_pos = 0
+        self._loaded_annotations: List[Annotation] = []
+        
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_pending_save)
     
     def set_pdf_path(self, pdf_path: str) -> None:
         """
@@ -33,6 +173,11 @@ class AnnotationManager:
         Args:
             pdf_path: Path to the PDF file
         """
+        if pdf_path == self.pdf_path:
+            return
+        
+        # Pending edits belong to the previous document
+        self.flush_pending_save()
         self.pdf_path = pdf_path
     
     def add_annotation(self, annotation: Annotation) -> None:
@@ -42,10 +187,15 @@ class AnnotationManager:
         Args:
             annotation: Annotation to add
         """
-        # Save state before adding
-        self.undo_redo_stack.push_state(self.annotations)
+        action = AnnotationAction(
+            ActionType.ADD, annotation,
+            page_index=annotation.page_index, index=len(self.annotations)
+        )
+        self.undo_redo_stack.push_action(action)
+        self._log_action(action, reverse=False)
         
         self.annotations.append(annotation)
+        self._insert_into_index(len(self.annotations) - 1, annotation)
         self._check_for_changes()
         self._auto_save()
     
@@ -59,11 +209,23 @@ class AnnotationManager:
         Returns:
             True if annotation was found and removed
         """
-        if annotation in self.annotations:
-            # Save state before removing
-            self.undo_redo_stack.push_state(self.annotations)
+        index = self._index_of(annotation)
+        if index >= 0:
+            # Work with the stored instance; _index_of may have matched an
+            # equal copy, and the page buckets remove by identity
+            annotation = self.annotations[index]
+            action = AnnotationAction(
+                ActionType.REMOVE, annotation,
+                page_index=annotation.page_index, index=index
+            )
+            self.undo_redo_stack.push_action(action)
+            self._log_action(action, reverse=False)
             
-            self.annotations.remove(annotation)
+            del self.annotations[index]
+            self._remove_from_index(index, annotation)
+            if self._loading and index < self._load_pos:
+                # Later chunks go right after the loaded annotations
+                self._load_pos -= 1
             self.selected_annotation = None
             self._check_for_changes()
             self._auto_save()
@@ -82,43 +244,178 @@ class AnnotationManager:
         Returns:
             True if annotation was found and updated
         """
+        index = self._index_of(old_annotation)
+        if index < 0:
+            return False
+        
+        action = AnnotationAction(
+            ActionType.MODIFY, new_annotation, old_annotation,
+            page_index=new_annotation.page_index, index=index
+        )
+        self.undo_redo_stack.push_action(action)
+        self._log_action(action, reverse=False)
+        
+        old_annotation = self.annotations[index]
+        self.annotations[index] = new_annotation
+        self._replace_in_index(index, old_annotation, new_annotation)
+        self._check_for_changes()
+        self._auto_save()
+        return True
+    
+    def _index_of(self, annotation: Annotation) -> int:
+        """
+        Find the position of an annotation in self.annotations.
+        
+        Looks the instance up by identity first and only falls back to an
+        equality scan for annotations that are not the stored instance.
+        
+        Returns:
+            Index of the annotation, or -1 if it is not present
+        """
+        if self._positions is None:
+            self._positions = {id(ann): i for i, ann in enumerate(self.annotations)}
+        
+        index = self._positions.get(id(annotation), -1)
+        if index >= 0 and self.annotations[index] is annotation:
+            return index
+        
         try:
-            index = self.annotations.index(old_annotation)
-            # Save state before updating
-            self.undo_redo_stack.push_state(self.annotations)
-            
-            self.annotations[index] = new_annotation
-            self._check_for_changes()
-            self._auto_save()
-            return True
+            return self.annotations.index(annotation)
         except ValueError:
-            return False
+            return -1
+    
+    def _insert_into_index(self, index: int, annotation: Annotation) -> None:
+        """Update the lookup structures after inserting one annotation at index."""
+        if self._content_hash is not None:
+            self._content_hash += hash(annotation)
+        if self._changed_pages is not None:
+            self._changed_pages.add(annotation.page_index)
+        
+        appended = index == len(self.annotations) - 1
+        if self._positions is not None:
+            if appended:
+                self._positions[id(annotation)] = index
+            else:
+                # Every later position shifted
+                self._positions = None
+        
+        if self._by_page is None:
+            return
+        page_index = annotation.page_index
+        self._page_grids.pop(page_index, None)
+        if appended:
+            # Appending keeps bucket order in step with the list
+            self._by_page.setdefault(page_index, []).append(annotation)
+        else:
+            self._by_page[page_index] = [
+                ann for ann in self.annotations if ann.page_index == page_index
+            ]
+    
+    def _remove_from_index(self, index: int, annotation: Annotation) -> None:
+        """Update the lookup structures after deleting the annotation at index."""
+        if self._content_hash is not None:
+            self._content_hash -= hash(annotation)
+        if self._changed_pages is not None:
+            self._changed_pages.add(annotation.page_index)
+        
+        if self._positions is not None:
+            if index == len(self.annotations):
+                self._positions.pop(id(annotation), None)
+            else:
+                self._positions = None
+        
+        if self._by_page is None:
+            return
+        page_index = annotation.page_index
+        self._page_grids.pop(page_index, None)
+        bucket = self._by_page.get(page_index, [])
+        for i, ann in enumerate(bucket):
+            if ann is annotation:
+                del bucket[i]
+                break
+        if not bucket:
+            self._by_page.pop(page_index, None)
+    
+    def _replace_in_index(self, index: int, old_annotation: Annotation,
+                          new_annotation: Annotation) -> None:
+        """Update the lookup structures after replacing one annotation in place."""
+        if self._content_hash is not None:
+            self._content_hash += hash(new_annotation) - hash(old_annotation)
+        if self._changed_pages is not None:
+            self._changed_pages.add(old_annotation.page_index)
+            self._changed_pages.add(new_annotation.page_index)
+        
+        if self._positions is not None:
+            self._positions.pop(id(old_annotation), None)
+            self._positions[id(new_annotation)] = index
+        
+        page_index = new_annotation.page_index
+        bucket = self._by_page.get(page_index) if self._by_page is not None else None
+        if bucket is None or old_annotation.page_index != page_index:
+            self._by_page = None
+            self._page_grids.clear()
+            return
+        
+        for i, ann in enumerate(bucket):
+            if ann is old_annotation:
+                bucket[i] = new_annotation
+                break
+        self._page_grids.pop(page_index, None)
     
     def _check_for_changes(self) -> None:
         """
-        Check if current annotations differ from initial state.
+        Check if current annotations differ from the saved state.
         Updates has_unsaved_changes flag accordingly.
         """
-        # Compare current annotations with initial state
-        if len(self.annotations) != len(self.initial_annotations):
-            self.has_unsaved_changes = True
-            return
+        self.has_unsaved_changes = self._current_state() != self._saved_state
+    
+    def _current_state(self) -> Tuple[int, int]:
+        """Get the (count, content hash) pair of the current annotations."""
+        if self._content_hash is None:
+            self._content_hash = sum(map(hash, self.annotations))
+        return len(self.annotations), self._content_hash
+    
+    def _set_saved_state(self, annotations: Optional[List[Annotation]] = None) -> None:
+        """
+        Record the state that counts as saved.
         
-        # Check if all annotations match (order doesn't matter)
-        # Create a simplified comparison that ignores object identity
-        current_set = set(
-            (ann.page_index, ann.annotation_type.value, ann.color, 
-             str(ann.quads), str(ann.points), ann.stroke_width, ann.filled)
-            for ann in self.annotations
-        )
+        Args:
+            annotations: Saved contents (defaults to the current annotations)
+        """
+        if annotations is None:
+            self._saved_state = self._current_state()
+        else:
+            self._saved_state = (len(annotations), sum(map(hash, annotations)))
+    
+    def _invalidate_index(self) -> None:
+        """Drop the per-page buckets, grids, positions and content hash after a structural change."""
+        self._by_page = None
+        self._page_grids.clear()
+        self._positions = None
+        self._content_hash = None
+        self._changed_pages = None
+    
+    def take_changed_pages(self) -> Optional[Set[int]]:
+        """
+        Get the pages whose annotations changed since the last call.
         
-        initial_set = set(
-            (ann.page_index, ann.annotation_type.value, ann.color,
-             str(ann.quads), str(ann.points), ann.stroke_width, ann.filled)
-            for ann in self.initial_annotations
-        )
+        Lets views refresh only the pages an edit, undo or redo touched.
         
-        self.has_unsaved_changes = (current_set != initial_set)
+        Returns:
+            Set of page indices, or None if every page may have changed
+        """
+        pages = self._changed_pages
+        self._changed_pages = set()
+        return pages
+    
+    def _get_page_buckets(self) -> Dict[int, List[Annotation]]:
+        """Get the per-page annotation buckets, rebuilding them if needed."""
+        if self._by_page is None:
+            by_page: Dict[int, List[Annotation]] = {}
+            for ann in self.annotations:
+                by_page.setdefault(ann.page_index, []).append(ann)
+            self._by_page = by_page
+        return self._by_page
     
     def get_annotations_for_page(self, page_index: int) -> List[Annotation]:
         """
@@ -130,7 +427,50 @@ class AnnotationManager:
         Returns:
             List of annotations on the specified page
         """
-        return [ann for ann in self.annotations if ann.page_index == page_index]
+        return list(self._get_page_buckets().get(page_index, ()))
+    
+    def _get_page_hit_index(self, page_index: int, zoom: float) -> '_PageHitIndex':
+        """
+        Get the hit-test index for a page at a zoom level.
+        
+        Freehand hit areas are padded by the zoom-dependent tolerance, so
+        the index is rebuilt when the zoom changes.
+        
+        Args:
+            page_index: 0-based page index
+            zoom: Current zoom level
+            
+        Returns:
+            The page's _PageHitIndex
+        """
+        cached = self._page_grids.get(page_index)
+        if cached is not None and cached[0] == zoom:
+            return cached[1]
+        
+        index = _PageHitIndex(self._get_page_buckets().get(page_index, ()),
+                              zoom, self._grid_size)
+        self._page_grids[page_index] = (zoom, index)
+        return index
+    
+    def iter_annotations_by_page(self) -> Iterator[Tuple[int, List[Annotation]]]:
+        """
+        Iterate annotations grouped by page, in page order.
+        
+        Groups are produced one page at a time so consumers such as the
+        PDF exporter never hold a combined copy of every page's list.
+        
+        Yields:
+            (page_index, annotations on that page) pairs
+        """
+        # The per-page buckets already hold each page's slice in list
+        # order; only the page numbers need sorting
+        buckets = self._get_page_buckets()
+        for page_index in sorted(buckets):
+            yield page_index, list(buckets[page_index])
+    
+    def get_page_count_with_annotations(self) -> int:
+        """Get the number of distinct pages that carry annotations."""
+        return sum(1 for bucket in self._get_page_buckets().values() if bucket)
     
     def get_annotation_at_point(self, page_index: int, x: float, y: float, 
                                 zoom: float = 1.0) -> Optional[Annotation]:
@@ -146,11 +486,24 @@ class AnnotationManager:
         Returns:
             The topmost annotation at the point, or None
         """
-        page_annotations = self.get_annotations_for_page(page_index)
-        
-        # Check in reverse order (topmost first)
-        for ann in reversed(page_annotations):
-            if self._point_in_annotation(ann, x, y, zoom):
+        page_annotations = self._get_page_buckets().get(page_index)
+        if not page_annotations:
+            return None
+        
+        # Candidate boxes come from the point's grid cell and are checked
+        # against the packed bounds first; highlight boxes are exact, while
+        # stroke boxes only gate the per-segment test. Newer rows are on
+        # top, so scan in reverse.
+        pdf_x = x / zoom
+        pdf_y = y / zoom
+        index = self._get_page_hit_index(page_index, zoom)
+        min_x, min_y, max_x, max_y = index.min_x, index.min_y, index.max_x, index.max_y
+        
+        for row in reversed(index.candidates(pdf_x, pdf_y)):
+            if not (min_x[row] <= pdf_x <= max_x[row] and min_y[row] <= pdf_y <= max_y[row]):
+                continue
+            ann = page_annotations[index.owner[row]]
+            if index.exact[row] or self._point_in_annotation(ann, x, y, zoom):
                 return ann
         return None
     
@@ -173,18 +526,16 @@ class AnnotationManager:
         pdf_y = y / zoom
         
         if annotation.annotation_type in [AnnotationType.HIGHLIGHT, AnnotationType.UNDERLINE]:
-            # Check if point is in any of the quads
-            if annotation.quads:
-                for quad in annotation.quads:
-                    # quad format: [x0, y0, x1, y1, x2, y2, x3, y3]
-                    # We only need the bounding box
-                    min_x = min(quad[0], quad[2], quad[4], quad[6])
-                    max_x = max(quad[0], quad[2], quad[4], quad[6])
-                    min_y = min(quad[1], quad[3], quad[5], quad[7])
-                    max_y = max(quad[1], quad[3], quad[5], quad[7])
-                    
-                    if min_x <= pdf_x <= max_x and min_y <= pdf_y <= max_y:
-                        return True
+            # Reject points outside the whole annotation first
+            bounds = annotation.bounds
+            if bounds is None or not (bounds[0] <= pdf_x <= bounds[2] and
+                                      bounds[1] <= pdf_y <= bounds[3]):
+                return False
+            
+            # Check if point is in any of the quads' (cached) bounding boxes
+            for min_x, min_y, max_x, max_y in annotation.quad_bounds:
+                if min_x <= pdf_x <= max_x and min_y <= pdf_y <= max_y:
+                    return True
         
         elif annotation.annotation_type == AnnotationType.FREEHAND:
             # Check if point is near the freehand path
@@ -192,47 +543,61 @@ class AnnotationManager:
                 # Simplified check: see if point is near any segment
                 tolerance = max(annotation.stroke_width + 2.0, 5.0) / zoom
                 
-                for i in range(len(annotation.points) - 1):
-                    p1 = annotation.points[i]
-                    p2 = annotation.points[i + 1]
-                    
-                    # Check distance to line segment
-                    if self._point_near_line(pdf_x, pdf_y, p1[0], p1[1], 
-                                           p2[0], p2[1], tolerance):
-                        return True
+                # Reject points outside the stroke's padded bounding box
+                # before testing individual segments
+                min_x, min_y, max_x, max_y = annotation.point_bounds
+                if not (min_x - tolerance <= pdf_x <= max_x + tolerance and
+                        min_y - tolerance <= pdf_y <= max_y + tolerance):
+                    return False
+                
+                return self._point_near_polyline(pdf_x, pdf_y, annotation.points,
+                                                 tolerance * tolerance)
         
         return False
     
-    def _point_near_line(self, px: float, py: float, x1: float, y1: float, 
-                        x2: float, y2: float, tolerance: float) -> bool:
+    def _point_near_polyline(self, px: float, py: float,
+                             points: List[Tuple[float, float]],
+                             tolerance_sq: float) -> bool:
         """
-        Check if a point is near a line segment.
+        Check if a point is near any segment of a polyline.
+        
+        The whole stroke is tested in one loop, with the segment math
+        inlined and distances compared squared, so no call or square root
+        is paid per segment.
         
         Args:
             px, py: Point coordinates
-            x1, y1, x2, y2: Line segment endpoints
-            tolerance: Maximum distance to consider "near"
+            points: Polyline vertices
+            tolerance_sq: Square of the maximum distance to consider "near"
             
         Returns:
-            True if point is within tolerance of the line segment
+            True if point is within tolerance of some segment
         """
-        line_length_sq = (x2 - x1) ** 2 + (y2 - y1) ** 2
-        
-        if line_length_sq == 0:
-            # Line is a point
-            dist = ((px - x1) ** 2 + (py - y1) ** 2) ** 0.5
-            return dist <= tolerance
-        
-        # Calculate projection parameter
-        t = max(0, min(1, ((px - x1) * (x2 - x1) + (py - y1) * (y2 - y1)) / line_length_sq))
-        
-        # Find nearest point on line segment
-        nearest_x = x1 + t * (x2 - x1)
-        nearest_y = y1 + t * (y2 - y1)
-        
-        # Calculate distance
-        dist = ((px - nearest_x) ** 2 + (py - nearest_y) ** 2) ** 0.5
-        return dist <= tolerance
+        x1, y1 = points[0][0], points[0][1]
+        for p2 in points[1:]:
+            x2 = p2[0]
+            y2 = p2[1]
+            seg_x = x2 - x1
+            seg_y = y2 - y1
+            off_x = px - x1
+            off_y = py - y1
+            line_length_sq = seg_x * seg_x + seg_y * seg_y
+            
+            if line_length_sq:
+                # Project onto the segment, clamped to its endpoints
+                t = (off_x * seg_x + off_y * seg_y) / line_length_sq
+                if t > 1:
+                    t = 1
+                elif t < 0:
+                    t = 0
+                off_x -= t * seg_x
+                off_y -= t * seg_y
+            
+            if off_x * off_x + off_y * off_y <= tolerance_sq:
+                return True
+            x1 = x2
+            y1 = y2
+        return False
     
     def undo(self) -> bool:
         """
@@ -241,12 +606,13 @@ class AnnotationManager:
         Returns:
             True if undo was successful
         """
-        if not self.undo_redo_stack.can_undo():
+        if not self.can_undo():
             return False
         
-        previous_state = self.undo_redo_stack.undo(self.annotations)
-        if previous_state is not None:
-            self.annotations = previous_state
+        action = self.undo_redo_stack.undo()
+        if action is not None:
+            self._apply_action(action, reverse=True)
+            self._log_action(action, reverse=True)
             self.selected_annotation = None
             self._check_for_changes()
             self._auto_save()
@@ -260,42 +626,175 @@ class AnnotationManager:
         Returns:
             True if redo was successful
         """
-        if not self.undo_redo_stack.can_redo():
+        if not self.can_redo():
             return False
         
-        next_state = self.undo_redo_stack.redo(self.annotations)
-        if next_state is not None:
-            self.annotations = next_state
+        action = self.undo_redo_stack.redo()
+        if action is not None:
+            self._apply_action(action, reverse=False)
+            self._log_action(action, reverse=False)
             self.selected_annotation = None
             self._check_for_changes()
             self._auto_save()
             return True
         return False
     
+    def _apply_action(self, action: AnnotationAction, reverse: bool) -> None:
+        """
+        Apply a recorded action, or its inverse, to the annotation list.
+        
+        Args:
+            action: Action from the undo/redo stack
+            reverse: True to undo the action, False to redo it
+        """
+        kind = action.action_type
+        index = action.index
+        if kind == ActionType.MODIFY:
+            old = self.annotations[index]
+            new = action.old_annotation if reverse else action.annotation
+            self.annotations[index] = new
+            self._replace_in_index(index, old, new)
+        elif (kind == ActionType.ADD) == reverse:
+            # Undoing an add or redoing a remove
+            removed = self.annotations.pop(index)
+            self._remove_from_index(index, removed)
+        else:
+            # Undoing a remove or redoing an add
+            self.annotations.insert(index, action.annotation)
+            self._insert_into_index(index, action.annotation)
+    
+    def _log_action(self, action: AnnotationAction, reverse: bool) -> None:
+        """
+        Queue the effective list edit of an action for the edit log.
+        
+        Args:
+            action: Action that was applied
+            reverse: True if it was applied as an undo
+        """
+        if not self.pdf_path:
+            return
+        
+        if self._loading:
+            # Indices shift as loaded chunks arrive; write a full snapshot
+            self._force_snapshot = True
+            return
+        
+        kind = action.action_type
+        if kind == ActionType.MODIFY:
+            annotation = action.old_annotation if reverse else action.annotation
+            entry = {'op': 'modify', 'index': action.index,
+                     'annotation': annotation.to_dict()}
+        elif (kind == ActionType.ADD) == reverse:
+            entry = {'op': 'remove', 'index': action.index}
+        else:
+            entry = {'op': 'add', 'index': action.index,
+                     'annotation': action.annotation.to_dict()}
+        self._pending_log.append(entry)
+    
     def can_undo(self) -> bool:
-        """Check if undo is available."""
-        return self.undo_redo_stack.can_undo()
+        """
+        Check if undo is available.
+        
+        Not while annotations are loading: recorded indices go stale as
+        loaded chunks are inserted ahead of them (the history is cleared
+        when loading finishes).
+        """
+        return not self._loading and self.undo_redo_stack.can_undo()
     
     def can_redo(self) -> bool:
-        """Check if redo is available."""
-        return self.undo_redo_stack.can_redo()
+        """Check if redo is available (not while annotations are loading)."""
+        return not self._loading and self.undo_redo_stack.can_redo()
     
     def clear_all(self) -> None:
         """Clear all annotations and reset state."""
+        self._end_loading()
+        self.flush_pending_save()
         self.annotations.clear()
-        self.initial_annotations.clear()
+        self._invalidate_index()
+        self._set_saved_state()
         self.has_unsaved_changes = False
         self.pdf_path = None
         self.selected_annotation = None
         self.undo_redo_stack.clear()
     
     def _auto_save(self) -> None:
-        """Automatically save annotations to JSON file."""
+        """Schedule an automatic save of the annotations to JSON."""
         if self.pdf_path:
-            try:
-                self.persistence.save_to_json(self.annotations, self.pdf_path)
-            except Exception as e:
-                print(f"Auto-save failed: {e}")
+            # Restarting the timer folds a burst of edits into one write
+            self._save_timer.start()
+    
+    def _do_save_async(self, compact: bool = False) -> None:
+        """
+        Write pending edits on the save thread.
+        
+        Edits are appended to the persistence log while it is short; a full
+        snapshot (which also truncates the log) is written when there is no
+        snapshot to log against, when the log has grown past its limit, or
+        when compact is requested.
+        
+        Args:
+            compact: Always write a full snapshot
+        """
+        if self._loading:
+            # Never persist a partially loaded document
+            return
+        
+        entries = self._pending_log
+        self._pending_log = []
+        if self._force_snapshot:
+            compact = True
+            self._force_snapshot = False
+        if not self.pdf_path:
+            return
+        
+        try:
+            file_path = self.persistence.get_json_path(self.pdf_path)
+            if (not compact and entries
+                    and self.persistence.can_append(file_path)
+                    and not self.persistence.needs_compaction(file_path, len(self.annotations))):
+                task = _AutoSaveTask(self.persistence, file_path, entries=entries)
+            elif entries or compact:
+                data = {
+                    'pdf_path': self.pdf_path,
+                    'annotations': [ann.to_dict() for ann in self.annotations]
+                }
+                task = _AutoSaveTask(self.persistence, file_path, data=data)
+            else:
+                return
+        except Exception as e:
+            print(f"Auto-save failed: {e}")
+            return
+        
+        queued = [t for t in self._queued_saves if not t.started.is_set()]
+        if task.data is not None:
+            # A snapshot covers every earlier write to the same file, so
+            # drop the ones still waiting for the save thread
+            queued = [t for t in queued
+                      if t.file_path != file_path or not self._save_pool.tryTake(t)]
+        queued.append(task)
+        self._queued_saves = queued
+        self._save_pool.start(task)
+    
+    def flush_pending_save(self) -> None:
+        """
+        Write any scheduled auto-save now and wait for writes to finish.
+        
+        Called when leaving a document, so a non-empty edit log is folded
+        into the snapshot at the same time.
+        """
+        self._save_timer.stop()
+        self._save_pool.waitForDone()
+        
+        if self.pdf_path and (self._pending_log or self.persistence.has_log_entries(
+                self.persistence.get_json_path(self.pdf_path))):
+            self._do_save_async(compact=True)
+            self._save_pool.waitForDone()
+    
+    def _cancel_pending_save(self) -> None:
+        """Drop any scheduled auto-save and wait for writes in flight."""
+        self._save_timer.stop()
+        self._pending_log = []
+        self._save_pool.waitForDone()
     
     def save_to_json(self, file_path: Optional[str] = None) -> bool:
         """
@@ -310,6 +809,10 @@ class AnnotationManager:
         if not self.pdf_path:
             return False
         
+        if file_path is None:
+            # The snapshot supersedes any edits still waiting to be logged
+            self._cancel_pending_save()
+        
         return self.persistence.save_to_json(self.annotations, self.pdf_path, file_path)
     
     def load_from_json(self, file_path: Optional[str] = None) -> bool:
@@ -325,16 +828,107 @@ class AnnotationManager:
         if not self.pdf_path:
             return False
         
+        self._end_loading()
+        self._cancel_pending_save()
         annotations, success = self.persistence.load_from_json(self.pdf_path, file_path)
         if success:
             self.annotations = annotations
-            # Store initial state for change detection
-            import copy
-            self.initial_annotations = [copy.deepcopy(ann) for ann in annotations]
+            self._invalidate_index()
+            self._set_saved_state()
             self.has_unsaved_changes = False
             self.undo_redo_stack.clear()
         return success
     
+    def begin_loading(self, pdf_path: str) -> int:
+        """
+        Start a background load of the saved annotations for a PDF.
+        
+        Resets the manager to an empty document for pdf_path. Results are
+        then fed in with append_loaded_annotations() and completed with
+        finish_loading(), both of which ignore stale sessions.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Token identifying this load session
+        """
+        self._end_loading()
+        # Reopening the same file must not drop edits still waiting to be written
+        self.flush_pending_save()
+        self.set_pdf_path(pdf_path)
+        self._cancel_pending_save()
+        
+        self.annotations = []
+        self._invalidate_index()
+        self._set_saved_state()
+        self.has_unsaved_changes = False
+        self.selected_annotation = None
+        self.undo_redo_stack.clear()
+        
+        self._loading = True
+        self._load_pos = 0
+        self._loaded_annotations = []
+        return self._load_token
+    
+    def append_loaded_annotations(self, token: int, annotations: List[Annotation]) -> bool:
+        """
+        Add a chunk of loaded annotations.
+        
+        Args:
+            token: Session token from begin_loading()
+            annotations: Next annotations in file order
+            
+        Returns:
+            True if the chunk was added, False if the session is stale
+        """
+        if not self._loading or token != self._load_token:
+            return False
+        
+        if self._load_pos == len(self.annotations):
+            # Nothing was added by the user yet, so the chunk is a plain
+            # append and the lookup structures can be extended in place
+            # instead of being rebuilt for every chunk
+            for annotation in annotations:
+                self.annotations.append(annotation)
+                self._insert_into_index(len(self.annotations) - 1, annotation)
+        else:
+            self.annotations[self._load_pos:self._load_pos] = annotations
+            self._invalidate_index()
+        self._load_pos += len(annotations)
+        self._loaded_annotations.extend(annotations)
+        return True
+    
+    def finish_loading(self, token: int) -> int:
+        """
+        Complete a background load.
+        
+        Args:
+            token: Session token from begin_loading()
+            
+        Returns:
+            Number of annotations loaded, or -1 if the session is stale
+        """
+        if not self._loading or token != self._load_token:
+            return -1
+        
+        loaded = self._loaded_annotations
+        self._end_loading()
+        
+        self._set_saved_state(loaded)
+        # Recorded actions predate the loaded chunks' indices
+        self.undo_redo_stack.clear()
+        self._check_for_changes()
+        if self._force_snapshot:
+            self._auto_save()
+        return len(loaded)
+    
+    def _end_loading(self) -> None:
+        """Invalidate any background load session in progress."""
+        self._load_token += 1
+        self._loading = False
+        self._loaded_annotations = []
+    
     def auto_load_annotations(self) -> bool:
         """
         Try to automatically load annotations for the current PDF.
@@ -354,17 +948,18 @@ class AnnotationManager:
             True if deletion was successful
         """
         if self.pdf_path:
+            # A late auto-save would otherwise recreate the file
+            self._cancel_pending_save()
             success = self.persistence.delete_json_file(self.pdf_path)
             if success:
                 self.has_unsaved_changes = False
-                self.initial_annotations.clear()
+                self._set_saved_state([])
             return success
         return False
     
     def mark_saved(self) -> None:
         """Mark all changes as saved and update initial state."""
-        import copy
-        self.initial_annotations = [copy.deepcopy(ann) for ann in self.annotations]
+        self._set_saved_state()
         self.has_unsaved_changes = False
     
     def get_annotation_count(self) -> int:
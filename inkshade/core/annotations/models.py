@@ -1,7 +1,7 @@
 """
 Annotation data models and enums.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import List, Tuple, Optional
 from enum import Enum
 
@@ -24,9 +24,20 @@ class ActionType(Enum):
     MODIFY = "modify"
 
 
-@dataclass
+# Drawing points are stored to this many decimal places of a PDF point
+# (0.01 pt), well below anything visible at the supported zoom levels
+POINT_DECIMALS = 2
+
+
+@dataclass(frozen=True, slots=True)
 class Annotation:
-    """Represents a single annotation on a PDF page."""
+    """
+    Represents a single annotation on a PDF page.
+    
+    Annotations are immutable; edits produce a new instance (see
+    with_color), so instances can be shared freely between the document,
+    the undo history and the on-disk snapshot.
+    """
     page_index: int  # 0-based page index
     annotation_type: AnnotationType
     color: Tuple[int, int, int]  # RGB tuple (0-255)
@@ -41,23 +52,152 @@ class Annotation:
     stroke_width: float = 2.0
     filled: bool = False
     
+    # Lazily computed hit-test boxes (see quad_bounds / point_bounds)
+    _quad_bounds: Optional[List[Tuple[float, float, float, float]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _point_bounds: Optional[Tuple[float, float, float, float]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _bounds: Optional[Tuple[float, float, float, float]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __hash__(self) -> int:
+        """Hash of the annotation's content, computed once; equal annotations hash equal."""
+        value = self._hash
+        if value is None:
+            value = hash((
+                self.page_index,
+                self.annotation_type,
+                tuple(self.color),
+                tuple(map(tuple, self.quads)) if self.quads is not None else None,
+                tuple(map(tuple, self.points)) if self.points is not None else None,
+                self.stroke_width,
+                self.filled,
+            ))
+            object.__setattr__(self, '_hash', value)
+        return value
+    
+    def __eq__(self, other) -> bool:
+        """
+        Compare annotations by content.
+        
+        Most unequal pairs differ in their cached hashes, which rejects
+        them without comparing quads or points element by element.
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if hash(self) != hash(other):
+            return False
+        return (
+            self.page_index == other.page_index
+            and self.annotation_type == other.annotation_type
+            and self.color == other.color
+            and self.stroke_width == other.stroke_width
+            and self.filled == other.filled
+            and self.quads == other.quads
+            and self.points == other.points
+        )
+    
+    def with_color(self, color: Tuple[int, int, int]) -> 'Annotation':
+        """
+        Return a copy of this annotation with a different color.
+        
+        The copy shares the quads/points lists with the original instead
+        of duplicating the geometry, so treat them as read-only.
+        
+        Args:
+            color: New RGB tuple (0-255)
+        """
+        return replace(self, color=color)
+    
+    @property
+    def quad_bounds(self) -> List[Tuple[float, float, float, float]]:
+        """
+        Axis-aligned (min_x, min_y, max_x, max_y) box of each quad.
+        
+        Computed on first use and cached; annotations are immutable, so
+        the cache never goes stale.
+        """
+        bounds = self._quad_bounds
+        if bounds is None:
+            # Split every quad into its x and y coordinates once, then
+            # reduce column-wise so min/max run over whole columns
+            quads = self.quads or ()
+            xs = [quad[0::2] for quad in quads]
+            ys = [quad[1::2] for quad in quads]
+            bounds = list(zip(map(min, xs), map(min, ys), map(max, xs), map(max, ys)))
+            object.__setattr__(self, '_quad_bounds', bounds)
+        return bounds
+    
+    @property
+    def point_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """Cached (min_x, min_y, max_x, max_y) box of the drawing points."""
+        if not self.points:
+            return None
+        bounds = self._point_bounds
+        if bounds is None:
+            xs = [p[0] for p in self.points]
+            ys = [p[1] for p in self.points]
+            bounds = (min(xs), min(ys), max(xs), max(ys))
+            object.__setattr__(self, '_point_bounds', bounds)
+        return bounds
+    
+    @property
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Cached (min_x, min_y, max_x, max_y) box of the whole annotation.
+        
+        Covers every quad of text annotations, or the points of drawings;
+        None if the annotation has no geometry. Lets callers reject the
+        annotation before looking at its quads or segments.
+        """
+        bounds = self._bounds
+        if bounds is None:
+            quad_bounds = self.quad_bounds
+            if quad_bounds:
+                min_xs, min_ys, max_xs, max_ys = zip(*quad_bounds)
+                bounds = (min(min_xs), min(min_ys), max(max_xs), max(max_ys))
+            else:
+                bounds = self.point_bounds
+            if bounds is None:
+                return None
+            object.__setattr__(self, '_bounds', bounds)
+        return bounds
+    
     def to_dict(self) -> dict:
-        """Convert annotation to dictionary for JSON serialization."""
+        """
+        Convert annotation to dictionary for JSON serialization.
+        
+        The dictionary is built once and cached, so saving a document only
+        rebuilds annotations created since the last save. Callers get a
+        shallow copy, and the cached geometry is held as tuples, so neither
+        the cache nor this annotation's quads/points can be changed
+        through the result.
+        """
+        data = self._dict
+        if data is not None:
+            return dict(data)
+        
         data = {
             'page_index': self.page_index,
             'type': self.annotation_type.value,
-            'color': list(self.color),
+            'color': tuple(self.color),
             'stroke_width': self.stroke_width,
             'filled': self.filled
         }
         
         if self.quads is not None:
-            data['quads'] = self.quads
+            data['quads'] = tuple(map(tuple, self.quads))
         
         if self.points is not None:
-            data['points'] = [[x, y] for x, y in self.points]
+            data['points'] = tuple((round(x, POINT_DECIMALS), round(y, POINT_DECIMALS))
+                                   for x, y in self.points)
         
-        return data
+        object.__setattr__(self, '_dict', data)
+        return dict(data)
     
     @staticmethod
     def from_dict(data: dict) -> 'Annotation':
@@ -77,10 +217,16 @@ class Annotation:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnnotationAction:
-    """Represents an action that can be undone/redone."""
+    """
+    Represents an action that can be undone/redone.
+    
+    Actions are compact immutable records that reference the annotations
+    involved rather than copies of them.
+    """
     action_type: ActionType
     annotation: Annotation
     old_annotation: Optional[Annotation] = None  # For modify actions
-    page_index: int = -1
\ No newline at end of file
+    page_index: int = -1
+    index: int = -1  # Position in the annotation list the action applies to
\ No newline at end of file
@@ -4,15 +4,78 @@ Handles persistence of annotations to/from JSON files.
 import json
 import os
 import hashlib
-from typing import List, Optional, Tuple
+import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
 from .models import Annotation
 
+# orjson is optional; it is several times faster than the json module
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
+# zstandard is optional; large snapshots are compressed when it is present
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:
+    zstandard = None
+
+# First bytes of every zstd frame
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class AnnotationPersistence:
-    """Manages saving and loading annotations to/from disk."""
+    """
+    Manages saving and loading annotations to/from disk.
+    
+    Each PDF has a JSON snapshot plus an optional append-only log of edits
+    (``<snapshot>.log``, one JSON action per line) that is replayed on top
+    of it when loading. Snapshots carry a random generation token and log
+    lines are only replayed if they carry the same token, so a log left
+    behind by an interrupted compaction is ignored rather than re-applied.
+    """
+    
+    # Compact once the log holds this many entries, or twice the number of
+    # annotations in the document, whichever is larger
+    MIN_LOG_ENTRIES_BEFORE_COMPACT = 64
+    
+    # Snapshots at least this large are written zstd-compressed when
+    # zstandard is installed; smaller ones stay plain JSON
+    COMPRESS_THRESHOLD_BYTES = 64 * 1024
     
     def __init__(self):
         self._app_data_dir: Optional[str] = None
+        
+        # Guards the per-path bookkeeping below: write_json and append_log
+        # update it on the auto-save thread while the GUI thread reads it
+        self._lock = threading.Lock()
+        
+        # Per snapshot path: generation token of the snapshot on disk and
+        # the number of log entries written against it
+        self._generations: Dict[str, str] = {}
+        self._log_counts: Dict[str, int] = {}
+        
+        # Per snapshot path: digest of the content last written there
+        # (excluding the generation token), to skip identical rewrites
+        self._snapshot_digests: Dict[str, bytes] = {}
+        
+        # PDF path -> resolved snapshot path (hashing plus legacy check)
+        self._json_paths: Dict[str, str] = {}
     
     def get_app_data_dir(self) -> str:
         """
@@ -45,13 +108,34 @@ class AnnotationPersistence:
         Returns:
             Path to the corresponding JSON annotations file
         """
+        cached = self._json_paths.get(pdf_path)
+        if cached is not None:
+            return cached
+        
         # Create a hash of the PDF path to use as filename
         # This ensures unique storage per PDF regardless of location
-        path_hash = hashlib.md5(pdf_path.encode()).hexdigest()
+        path_bytes = pdf_path.encode('utf-8')
+        path_hash = hashlib.blake2b(path_bytes, digest_size=16).hexdigest()
         
         # Store JSON in app data directory with hashed filename
         app_dir = self.get_app_data_dir()
-        return os.path.join(app_dir, f"{path_hash}.json")
+        json_path = os.path.join(app_dir, f"{path_hash}.json")
+        
+        # Files used to be named by MD5; adopt one under the new name once.
+        # The digest is only a file name, which also keeps FIPS-mode
+        # OpenSSL builds from rejecting it.
+        if not os.path.exists(json_path):
+            legacy_hash = hashlib.md5(path_bytes, usedforsecurity=False).hexdigest()
+            legacy_path = os.path.join(app_dir, f"{legacy_hash}.json")
+            if os.path.exists(legacy_path):
+                try:
+                    os.replace(legacy_path, json_path)
+                except OSError as e:
+                    print(f"Failed to migrate annotation file: {e}")
+                    return legacy_path
+        
+        self._json_paths[pdf_path] = json_path
+        return json_path
     
     def save_to_json(self, annotations: List[Annotation], pdf_path: str, 
                      file_path: Optional[str] = None) -> bool:
@@ -69,22 +153,190 @@ class AnnotationPersistence:
         if file_path is None:
             file_path = self.get_json_path(pdf_path)
         
-        try:
-            data = {
-                'pdf_path': pdf_path,
-                'annotations': [ann.to_dict() for ann in annotations]
-            }
+        data = {
+            'pdf_path': pdf_path,
+            'annotations': [ann.to_dict() for ann in annotations]
+        }
+        return self.write_json(data, file_path)
+    
+    def write_json(self, data: dict, file_path: str) -> bool:
+        """
+        Atomically write already-serialized annotation data to disk.
+        
+        The data is written to a temporary file next to the target and then
+        moved over it, so readers never see a half-written file. If the
+        content matches the snapshot this instance last wrote there, the
+        write is skipped and only the edit log is discarded. Safe to call
+        from a worker thread.
+        
+        Args:
+            data: Dictionary as produced for save_to_json
+            file_path: Destination JSON path
             
+        Returns:
+            True if save was successful, False otherwise
+        """
+        temp_path = None
+        try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            directory = os.path.dirname(file_path)
+            os.makedirs(directory, exist_ok=True)
+            
+            payload = _dumps(data)
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
             
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._lock:
+                unchanged = (self._snapshot_digests.get(file_path) == digest
+                             and file_path in self._generations)
+            if unchanged and os.path.exists(file_path):
+                # Logged edits cancelled out; the snapshot is still current
+                with self._lock:
+                    self._log_counts[file_path] = 0
+            else:
+                # Splice the generation token in as the first field rather
+                # than serializing the data a second time
+                generation = os.urandom(8).hex()
+                header = b'{"generation":"' + generation.encode('ascii') + b'"'
+                body = header + (b',' + payload[1:] if len(payload) > 2 else b'}')
+                if zstandard is not None and len(body) >= self.COMPRESS_THRESHOLD_BYTES:
+                    body = zstandard.ZstdCompressor(level=3).compress(body)
+                
+                temp_fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+                with os.fdopen(temp_fd, 'wb') as f:
+                    f.write(body)
+                os.replace(temp_path, file_path)
+                
+                # The snapshot now contains everything the log described
+                with self._lock:
+                    self._generations[file_path] = generation
+                    self._log_counts[file_path] = 0
+                    self._snapshot_digests[file_path] = digest
+            
+            log_path = self.get_log_path(file_path)
+            if os.path.exists(log_path):
+                os.remove(log_path)
             return True
         except Exception as e:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
             print(f"Failed to save annotations: {e}")
             return False
     
+    def get_log_path(self, file_path: str) -> str:
+        """Get the edit-log path belonging to a JSON snapshot path."""
+        return f"{file_path}.log"
+    
+    def can_append(self, file_path: str) -> bool:
+        """Check whether edits can be logged against the snapshot on disk."""
+        with self._lock:
+            return file_path in self._generations
+    
+    def needs_compaction(self, file_path: str, annotation_count: int) -> bool:
+        """
+        Check whether the edit log has grown enough to rewrite the snapshot.
+        
+        Args:
+            file_path: Snapshot path
+            annotation_count: Number of annotations currently in the document
+        """
+        limit = max(self.MIN_LOG_ENTRIES_BEFORE_COMPACT, 2 * annotation_count)
+        with self._lock:
+            return self._log_counts.get(file_path, 0) >= limit
+    
+    def has_log_entries(self, file_path: str) -> bool:
+        """Check whether edits have been logged since the last snapshot."""
+        with self._lock:
+            return self._log_counts.get(file_path, 0) > 0
+    
+    def append_log(self, file_path: str, entries: List[dict]) -> bool:
+        """
+        Append edit actions to the log of a snapshot.
+        
+        Each entry is ``{'op': 'add'|'remove'|'modify', 'index': int}`` plus
+        ``'annotation'`` (a to_dict() payload) for add and modify. Safe to
+        call from a worker thread.
+        
+        Args:
+            file_path: Snapshot path the entries apply to
+            entries: Actions in the order they were performed
+            
+        Returns:
+            True if the entries were written, False otherwise
+        """
+        with self._lock:
+            generation = self._generations.get(file_path)
+        if generation is None:
+            return False
+        
+        try:
+            with open(self.get_log_path(file_path), 'ab') as f:
+                f.writelines(
+                    _dumps(dict(entry, gen=generation)) + b'\n' for entry in entries
+                )
+            with self._lock:
+                self._log_counts[file_path] = self._log_counts.get(file_path, 0) + len(entries)
+            return True
+        except Exception as e:
+            print(f"Failed to append annotation log: {e}")
+            return False
+    
+    def _replay_log(self, file_path: str, generation: Optional[str],
+                    annotations: List[Annotation]) -> int:
+        """
+        Apply logged edits for a snapshot generation to its annotations.
+        
+        Returns:
+            Number of log entries applied
+        """
+        log_path = self.get_log_path(file_path)
+        if generation is None or not os.path.exists(log_path):
+            return 0
+        
+        applied = 0
+        # End of the last line replay got past, and whether it stopped early
+        good_end = 0
+        stopped = False
+        with open(log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn final line from an interrupted write
+                    stopped = True
+                    break
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    stopped = True
+                    break
+                if entry.get('gen') != generation:
+                    good_end += len(line)
+                    continue
+                
+                op = entry['op']
+                index = entry['index']
+                try:
+                    if op == 'add':
+                        annotations.insert(index, Annotation.from_dict(entry['annotation']))
+                    elif op == 'remove':
+                        del annotations[index]
+                    elif op == 'modify':
+                        annotations[index] = Annotation.from_dict(entry['annotation'])
+                except (IndexError, KeyError, ValueError) as e:
+                    print(f"Stopped replaying annotation log: {e}")
+                    stopped = True
+                    break
+                applied += 1
+                good_end += len(line)
+        
+        if stopped:
+            # Cut the log after the last good line; entries appended later
+            # would otherwise sit behind a line replay never gets past
+            try:
+                with open(log_path, 'r+b') as f:
+                    f.truncate(good_end)
+            except OSError as e:
+                print(f"Failed to truncate annotation log: {e}")
+        return applied
+    
     def load_from_json(self, pdf_path: str, 
                        file_path: Optional[str] = None) -> Tuple[List[Annotation], bool]:
         """
@@ -104,8 +356,7 @@ class AnnotationPersistence:
             return [], False
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            data = _loads(self._read_snapshot(file_path))
             
             # Verify this is for the correct PDF
             stored_pdf_path = data.get('pdf_path')
@@ -114,11 +365,29 @@ class AnnotationPersistence:
             
             annotations = [Annotation.from_dict(ann_data) 
                           for ann_data in data.get('annotations', [])]
+            
+            generation = data.get('generation')
+            applied = self._replay_log(file_path, generation, annotations)
+            if generation is not None:
+                with self._lock:
+                    self._generations[file_path] = generation
+                    self._log_counts[file_path] = applied
             return annotations, True
         except Exception as e:
             print(f"Failed to load annotations: {e}")
             return [], False
     
+    def _read_snapshot(self, file_path: str) -> bytes:
+        """Read a snapshot file's JSON, decompressing it if it is zstd-compressed."""
+        with open(file_path, 'rb') as f:
+            payload = f.read()
+        
+        if payload[:4] == _ZSTD_MAGIC:
+            if zstandard is None:
+                raise ValueError("Snapshot is zstd-compressed but zstandard is not installed")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        return payload
+    
     def delete_json_file(self, pdf_path: str) -> bool:
         """
         Delete the JSON annotation file for a PDF.
@@ -130,12 +399,17 @@ class AnnotationPersistence:
             True if deletion was successful or file didn't exist
         """
         file_path = self.get_json_path(pdf_path)
-        
-        if not os.path.exists(file_path):
-            return True
+        log_path = self.get_log_path(file_path)
+        with self._lock:
+            self._generations.pop(file_path, None)
+            self._log_counts.pop(file_path, None)
+            self._snapshot_digests.pop(file_path, None)
         
         try:
-            os.remove(file_path)
+            if os.path.exists(log_path):
+                os.remove(log_path)
+            if os.path.exists(file_path):
+                os.remove(file_path)
             return True
         except Exception as e:
             print(f"Failed to delete JSON file: {e}")
@@ -1,42 +1,44 @@
 """
 Undo/Redo functionality for annotations.
 """
-from typing import List, Optional
-import copy
-from .models import Annotation
+from collections import deque
+from typing import Deque, Optional
+from .models import AnnotationAction
 
 
 class UndoRedoStack:
-    """Manages undo/redo operations for annotations."""
+    """
+    Manages undo/redo operations for annotations.
+    
+    History is a log of single-annotation actions rather than snapshots of
+    the whole list, so recording an edit costs O(1) regardless of how many
+    annotations the document has. Annotations are never mutated in place
+    (edits replace them), so actions hold plain references.
+    """
     
     def __init__(self, max_size: int = 50):
         """
         Initialize the undo/redo stack.
         
         Args:
-            max_size: Maximum number of states to keep in history
+            max_size: Maximum number of actions to keep in history
         """
-        self.undo_stack: List[List[Annotation]] = []
-        self.redo_stack: List[List[Annotation]] = []
+        # Bounded deques drop the oldest entry themselves once full
+        self.undo_stack: Deque[AnnotationAction] = deque(maxlen=max_size)
+        self.redo_stack: Deque[AnnotationAction] = deque(maxlen=max_size)
         self.max_size = max_size
     
-    def push_state(self, annotations: List[Annotation]) -> None:
+    def push_action(self, action: AnnotationAction) -> None:
         """
-        Push current state to undo stack.
+        Record a newly performed action.
         
         Args:
-            annotations: Current list of annotations to save
+            action: The action that was just applied
         """
-        # Deep copy the annotations
-        state = [copy.deepcopy(ann) for ann in annotations]
-        self.undo_stack.append(state)
+        self.undo_stack.append(action)
         
         # Clear redo stack when new action is performed
         self.redo_stack.clear()
-        
-        # Limit stack size
-        if len(self.undo_stack) > self.max_size:
-            self.undo_stack.pop(0)
     
     def can_undo(self) -> bool:
         """Check if undo is available."""
@@ -46,45 +48,35 @@ class UndoRedoStack:
         """Check if redo is available."""
         return len(self.redo_stack) > 0
     
-    def undo(self, current_state: List[Annotation]) -> Optional[List[Annotation]]:
+    def undo(self) -> Optional[AnnotationAction]:
         """
-        Perform undo and return the previous state.
+        Take the most recent action for undoing.
         
-        Args:
-            current_state: Current annotations before undo
-            
         Returns:
-            Previous state of annotations, or None if undo not available
+            The action the caller should invert, or None if undo not available
         """
         if not self.can_undo():
             return None
         
-        # Save current state to redo stack
-        self.redo_stack.append([copy.deepcopy(ann) for ann in current_state])
-        
-        # Pop and return previous state
-        return self.undo_stack.pop()
+        action = self.undo_stack.pop()
+        self.redo_stack.append(action)
+        return action
     
-    def redo(self, current_state: List[Annotation]) -> Optional[List[Annotation]]:
+    def redo(self) -> Optional[AnnotationAction]:
         """
-        Perform redo and return the next state.
+        Take the most recently undone action for redoing.
         
-        Args:
-            current_state: Current annotations before redo
-            
         Returns:
-            Next state of annotations, or None if redo not available
+            The action the caller should re-apply, or None if redo not available
         """
         if not self.can_redo():
             return None
         
-        # Save current state to undo stack
-        self.undo_stack.append([copy.deepcopy(ann) for ann in current_state])
-        
-        # Pop and return next state
-        return self.redo_stack.pop()
+        action = self.redo_stack.pop()
+        self.undo_stack.append(action)
+        return action
     
     def clear(self) -> None:
         """Clear both stacks."""
         self.undo_stack.clear()
-        self.redo_stack.clear()
\ No newline at end of file
+        self.redo_stack.clear()
@@ -3,5 +3,6 @@ PDF document handling and manipulation.
 """
 from .pdf_reader import PDFDocumentReader
 from .pdf_exporter import PDFExporter
+from .load_worker import DocumentLoadWorker
 
-__all__ = ['PDFDocumentReader', 'PDFExporter']
\ No newline at end of file
+__all__ = ['PDFDocumentReader', 'PDFExporter', 'DocumentLoadWorker']
\ No newline at end of file
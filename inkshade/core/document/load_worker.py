@@ -0,0 +1,48 @@
+"""
+Background worker for opening PDF documents.
+"""
+
+import os
+
+import fitz  # PyMuPDF
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# Files up to this size are read into memory here and opened from there,
+# so later page loads never wait on the disk; larger files are opened by
+# path rather than held in memory whole
+PREFETCH_MAX_BYTES = 200 * 1024 * 1024
+
+
+def _read_file(file_path: str) -> bytes:
+    """Read a whole file, hinting the OS to read ahead sequentially."""
+    with open(file_path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return f.read()
+
+
+class DocumentLoadWorker(QThread):
+    """Worker thread that opens a PDF without freezing the UI."""
+
+    # Signals
+    loaded = pyqtSignal(str, object)  # file path, fitz.Document
+    failed = pyqtSignal(str, str)  # file path, error message
+
+    def __init__(self, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+
+    def run(self):
+        """Open the document in the background thread."""
+        try:
+            if os.path.getsize(self.file_path) <= PREFETCH_MAX_BYTES:
+                doc = fitz.open(stream=_read_file(self.file_path), filetype="pdf")
+            else:
+                doc = fitz.open(self.file_path)
+            # Touch the page tree so the xref is fully parsed off the GUI thread
+            _ = doc.page_count
+        except Exception as e:
+            self.failed.emit(self.file_path, str(e))
+            return
+
+        self.loaded.emit(self.file_path, doc)
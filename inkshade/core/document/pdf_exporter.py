@@ -1,6 +1,8 @@
 import fitz  # PyMuPDF
 from inkshade.core.annotations import AnnotationType, Annotation
-from typing import List
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, List, Tuple
 from PyQt5.QtCore import QObject, pyqtSignal
 
 class PDFExporter(QObject):
@@ -21,6 +23,35 @@ class PDFExporter(QObject):
             output_pdf_path: Path where the annotated PDF should be saved
             annotations: List of annotations to add to the PDF
             
+        Returns:
+            True if successful, False otherwise
+        """
+        # Group annotations by page lazily; no per-page lists are kept alive
+        # once the page has been written.
+        by_page = sorted(annotations, key=attrgetter('page_index'))
+        pages = (
+            (page_idx, list(page_annotations))
+            for page_idx, page_annotations in groupby(by_page, key=attrgetter('page_index'))
+        )
+        total_pages = len({ann.page_index for ann in annotations})
+        
+        return self.export_pages_to_pdf(source_pdf_path, output_pdf_path, pages, total_pages)
+    
+    def export_pages_to_pdf(self, source_pdf_path: str, output_pdf_path: str,
+                            pages: Iterable[Tuple[int, List[Annotation]]],
+                            total_pages: int = 0) -> bool:
+        """
+        Export annotations streamed page by page.
+        
+        Each (page_index, annotations) pair is written as soon as it is
+        produced, so only one page's annotations need to exist at a time.
+        
+        Args:
+            source_pdf_path: Path to the original PDF
+            output_pdf_path: Path where the annotated PDF should be saved
+            pages: Iterable of (page_index, annotations on that page)
+            total_pages: Number of pages the iterable yields, for progress
+            
         Returns:
             True if successful, False otherwise
         """
@@ -28,18 +59,10 @@ class PDFExporter(QObject):
             # Open the PDF
             doc = fitz.open(source_pdf_path)
             
-            # Group annotations by page for efficiency
-            annotations_by_page = {}
-            for ann in annotations:
-                if ann.page_index not in annotations_by_page:
-                    annotations_by_page[ann.page_index] = []
-                annotations_by_page[ann.page_index].append(ann)
-            
-            total_pages = len(annotations_by_page)
             current_page = 0
             
             # Add annotations to each page
-            for page_idx, page_annotations in annotations_by_page.items():
+            for page_idx, page_annotations in pages:
                 if page_idx >= len(doc):
                     continue
                 
@@ -58,7 +81,7 @@ class PDFExporter(QObject):
             
             # Emit final progress
             try:
-                self.progress_signal.emit(total_pages, total_pages)
+                self.progress_signal.emit(current_page, max(total_pages, current_page))
             except:
                 pass
             
@@ -2,12 +2,28 @@
 PDF document reading and rendering functionality.
 """
 
+import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 from PyQt5.QtGui import QImage, QPixmap
-from PyQt5.QtWidgets import QMessageBox
+
+logger = logging.getLogger(__name__)
+
+# Runs of whitespace, control characters and surrogates in TOC titles.
+# A lone plain space is left alone so ordinary titles need no callbacks.
+_TOC_TITLE_RUN_RE = re.compile(
+    r"[\s\x00-\x1f\x7f-\x9f\ud800-\udfff]{2,}|[^\S ]|[\x00-\x1f\x7f-\x9f\ud800-\udfff]"
+)
+# Characters that leave a space behind: newlines and tabs, and whitespace
+# that is not a control character. Everything else in a run is dropped.
+_TOC_TITLE_SPACE_RE = re.compile(r"[\n\t]|[^\S\x00-\x1f\x7f-\x9f]")
+
+
+def _replace_toc_title_run(match: "re.Match") -> str:
+    """Collapse a run matched by _TOC_TITLE_RUN_RE to a space or nothing."""
+    return " " if _TOC_TITLE_SPACE_RE.search(match.group()) else ""
 
 
 class PDFDocumentReader:
@@ -16,35 +32,51 @@ class PDFDocumentReader:
     def __init__(self):
         self.doc: Optional[fitz.Document] = None
         self.total_pages: int = 0
-        self.toc: List[Tuple[int, str, int, float]] = []
+        # Processed table of contents, built on first get_toc() call
+        self.toc: Optional[List[Tuple[int, str, int, float]]] = None
         self.current_file_path: Optional[str] = None
+        # Message of the last load_pdf failure, for the caller to report
+        self.last_error: Optional[str] = None
+
+        # Named destination -> doc.resolve_link() result (None if it does
+        # not resolve), for the open document only
+        self._named_dests: Dict[str, Optional[Dict[str, Any]]] = {}
 
-    def load_pdf(self, file_path: str) -> Tuple[bool, int]:
+    def load_pdf(
+        self, file_path: str, doc: Optional[fitz.Document] = None
+    ) -> Tuple[bool, int]:
         """
         Load a PDF document.
 
         Args:
             file_path: Path to the PDF file
+            doc: Already opened document for file_path (e.g. opened by a
+                DocumentLoadWorker); opened here if not given
+
+        Errors are logged and stored in last_error rather than shown, so
+        reporting them is left to the GUI layer.
 
         Returns:
             Tuple of (success flag, number of pages)
         """
+        self.last_error = None
         try:
             # Close existing document if any
             if self.doc:
                 self.close_document()
 
-            self.doc = fitz.open(file_path)
+            self.doc = doc if doc is not None else fitz.open(file_path)
             self.total_pages = self.doc.page_count
             self.current_file_path = file_path
 
-            # Get table of contents with positioning info
-            self.toc = self._process_toc()
+            # The table of contents is processed when first requested
+            self.toc = None
 
             return True, self.total_pages
 
         except Exception as e:
-            QMessageBox.critical(None, "Error", f"Error loading PDF: {e}")
+            logger.exception("Error loading PDF %s", file_path)
+            self.last_error = str(e)
             return False, 0
 
     def close_document(self) -> None:
@@ -54,8 +86,9 @@ class PDFDocumentReader:
             self.doc = None
 
         self.total_pages = 0
-        self.toc = []
+        self.toc = None
         self.current_file_path = None
+        self._named_dests.clear()
 
     def render_page(
         self, page_index: int, zoom_level: float, dark_mode: bool
@@ -69,7 +102,8 @@ class PDFDocumentReader:
             dark_mode: Whether to invert colors for dark mode
 
         Returns:
-            Tuple of (pixmap, text_data, word_data)
+            Tuple of (pixmap, text_data, word_data); errors are logged and
+            give (None, None, None)
         """
         if not self.doc or page_index >= self.total_pages:
             return None, None, None
@@ -80,13 +114,17 @@ class PDFDocumentReader:
 
             # Render page to pixmap
             pix = page.get_pixmap(matrix=mat)
-            img = QImage(
-                pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888
-            )
 
-            # Apply dark mode if needed
+            # Apply dark mode if needed, inverting MuPDF's buffer in place
+            # so Qt never has to detach and copy the image to invert it
             if dark_mode:
-                img.invertPixels()
+                pix.invert_irect()
+
+            # Wrap MuPDF's sample buffer in place rather than copying it out
+            # through pix.samples; pix outlives the QPixmap conversion below
+            img = QImage(
+                pix.samples_ptr, pix.width, pix.height, pix.stride, QImage.Format_RGB888
+            )
 
             pixmap = QPixmap.fromImage(img)
 
@@ -96,10 +134,8 @@ class PDFDocumentReader:
 
             return pixmap, text_data, word_data
 
-        except Exception as e:
-            QMessageBox.critical(
-                None, "Error", f"Error rendering page {page_index + 1}: {e}"
-            )
+        except Exception:
+            logger.exception("Error rendering page %d", page_index + 1)
             return None, None, None
 
     def get_page(self, page_index: int) -> Optional[fitz.Page]:
@@ -120,6 +156,26 @@ class PDFDocumentReader:
         except Exception:
             return None
 
+    def resolve_named_dest(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a named destination of the open document.
+
+        Each lookup walks the PDF name tree, so results (including names
+        that do not resolve) are kept until the document is closed.
+
+        Args:
+            name: Destination name, without the leading '#'
+
+        Returns:
+            The doc.resolve_link() result, or None
+        """
+        if not self.doc or not name:
+            return None
+
+        if name not in self._named_dests:
+            self._named_dests[name] = self.doc.resolve_link(f"#{name}")
+        return self._named_dests[name]
+
     def get_page_size(self, page_index: int) -> Tuple[float, float]:
         """
         Get the size of a page in points.
@@ -140,9 +196,13 @@ class PDFDocumentReader:
         """
         Get the processed table of contents.
 
+        The TOC is processed on the first call for a document and cached.
+
         Returns:
             List of (level, title, page_num, y_position) tuples
         """
+        if self.toc is None:
+            self.toc = self._process_toc()
         return self.toc
 
     def _process_toc(self) -> List[Tuple[int, str, int, float]]:
@@ -160,6 +220,10 @@ class PDFDocumentReader:
         raw_toc = self.doc.get_toc(simple=False)
         processed_toc = []
 
+        # 0-based page index -> (rect height, mediabox y0, rect y0), so
+        # entries pointing at the same page load it only once
+        page_info: Dict[int, Tuple[float, float, float]] = {}
+
         for entry in raw_toc:
             if len(entry) >= 3:
                 level, title, page_num = entry[:3]
@@ -184,8 +248,13 @@ class PDFDocumentReader:
                             # page height, it's likely bottom-left origin
                             # (pointing to upper part of page).
                             try:
-                                page = self.doc.load_page(page_num - 1)
-                                page_height = page.rect.height
+                                info = page_info.get(page_num - 1)
+                                if info is None:
+                                    page = self.doc.load_page(page_num - 1)
+                                    rect = page.rect
+                                    info = (rect.height, page.mediabox.y0, rect.y0)
+                                    page_info[page_num - 1] = info
+                                page_height, mediabox_y0, rect_y0 = info
 
                                 # If y > page_height, it's invalid - use 0
                                 if raw_y > page_height:
@@ -196,31 +265,34 @@ class PDFDocumentReader:
                                     # Check if coordinate appears to be bottom-left
                                     # by seeing if the MediaBox origin differs from
                                     # the page rect origin
-                                    mediabox = page.mediabox
-
                                     # If mediabox y0 is 0 and the raw y is close to
                                     # page height, the coordinate is likely bottom-left
                                     # Use the page's transformation to convert properly
-                                    if mediabox.y0 == 0 and page.rect.y0 == 0:
+                                    if mediabox_y0 == 0 and rect_y0 == 0:
                                         # Standard page: flip from bottom-left to top-left
                                         y_pos = page_height - raw_y
                                     else:
                                         # Non-standard page: raw_y might already be
                                         # in page.rect coordinates
-                                        y_pos = raw_y - page.rect.y0
+                                        y_pos = raw_y - rect_y0
 
                                     # Clamp to valid range
                                     y_pos = max(0.0, min(y_pos, page_height))
 
-                                # DEBUG - remove after confirming fix works
-                                print(
-                                    f"TOC: '{title}' -> page {page_num}, "
-                                    f"raw_y={raw_y:.1f}, page_h={page_height:.1f}, "
-                                    f"converted_y={y_pos:.1f}"
+                                logger.debug(
+                                    "TOC: %r -> page %d, raw_y=%.1f, page_h=%.1f, "
+                                    "converted_y=%.1f",
+                                    title,
+                                    page_num,
+                                    raw_y,
+                                    page_height,
+                                    y_pos,
                                 )
 
                             except Exception as e:
-                                print(f"TOC y-conversion failed for '{title}': {e}")
+                                logger.warning(
+                                    "TOC y-conversion failed for %r: %s", title, e
+                                )
                                 y_pos = 0.0
 
                         # Also check for 'y' directly in details
@@ -245,23 +317,15 @@ class PDFDocumentReader:
         if not title:
             return f"Section {page_num}"
 
-        # Handle surrogate escape sequences from PyMuPDF
-        # Remove surrogate pair sequences (formatting characters)
-        cleaned_title = re.sub(r"[\udc00-\udfff]+", "", title)
-
-        # Remove isolated high surrogates
-        cleaned_title = re.sub(r"[\ud800-\udbff]+", "", cleaned_title)
-
-        # Clean up special characters
-        cleaned_title = cleaned_title.replace("\r", "")
-        cleaned_title = cleaned_title.replace("\n", " ")
-        cleaned_title = cleaned_title.replace("\t", " ")
-
-        # Remove control characters
-        cleaned_title = re.sub(r"[\x00-\x1f\x7f-\x9f]", "", cleaned_title)
+        # Most titles are plain printable ASCII with single spaces and need
+        # nothing beyond stripping
+        if title.isascii() and title.isprintable() and "  " not in title:
+            return title.strip() or f"Section {page_num}"
 
-        # Clean up multiple spaces
-        cleaned_title = re.sub(r"\s+", " ", cleaned_title)
+        # In a single pass, drop the surrogate escape sequences PyMuPDF
+        # leaves for formatting characters and other control characters,
+        # turn newlines and tabs into spaces and collapse repeated spaces
+        cleaned_title = _TOC_TITLE_RUN_RE.sub(_replace_toc_title_run, title)
         cleaned_title = cleaned_title.strip()
 
         # If title is empty after cleaning, provide a default
@@ -1,10 +1,11 @@
 # core/export_worker.py
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from inkshade.core.document.pdf_exporter import PDFExporter
 import tempfile
 import shutil
 import os
+import time
 
 
 class ExportWorker(QThread):
@@ -15,20 +16,39 @@ class ExportWorker(QThread):
     progress = pyqtSignal(str)  # status message
     page_progress = pyqtSignal(int, int)  # current, total pages
     
-    def __init__(self, source_pdf, output_pdf, annotations, use_temp_file=False):
+    # page_progress is emitted at most this often (seconds) unless the
+    # export advanced by PROGRESS_PAGE_STEP pages or finished
+    PROGRESS_MIN_INTERVAL = 0.033
+    PROGRESS_PAGE_STEP = 16
+    
+    def __init__(self, source_pdf, output_pdf, annotations, use_temp_file=False,
+                 sync_to_disk=False):
         super().__init__()
         self.source_pdf = source_pdf
         self.output_pdf = output_pdf
         self.annotations = annotations
         self.use_temp_file = use_temp_file
+        # Flush the temp file to disk before it replaces the original, so a
+        # crash cannot leave a truncated PDF behind (costs an fsync stall)
+        self.sync_to_disk = sync_to_disk
         self.temp_path = None
-        self.exporter = PDFExporter()
+        self.exporter = None
+        self._last_emit_ts = 0.0
+        self._last_emit_page = -1
     
     def run(self):
         """Execute the export in a background thread."""
         try:
-            # Connect exporter progress to our signal
-            self.exporter.progress_signal.connect(self._on_page_progress)
+            # Created here so the exporter (a QObject) belongs to this
+            # thread for its whole life
+            self.exporter = PDFExporter()
+            
+            # Connect exporter progress to our signal. The direct connection
+            # runs the handler on this thread, so coalescing happens before
+            # anything is queued to the GUI thread
+            self.exporter.progress_signal.connect(
+                self._on_page_progress, Qt.DirectConnection
+            )
             
             if self.use_temp_file:
                 # Create temp file in same directory
@@ -47,8 +67,15 @@ class ExportWorker(QThread):
                 
                 if success:
                     self.progress.emit("Finalizing...")
-                    # Replace original with temp file
-                    shutil.move(self.temp_path, self.output_pdf)
+                    if self.sync_to_disk:
+                        self._sync_file(self.temp_path)
+                    # Replace original with temp file. The temp file sits in
+                    # the output directory, so this is a single atomic rename;
+                    # shutil.move is only a fallback if the rename fails.
+                    try:
+                        os.replace(self.temp_path, self.output_pdf)
+                    except OSError:
+                        shutil.move(self.temp_path, self.output_pdf)
                     self.finished.emit(True, "Annotations saved successfully to PDF!")
                 else:
                     # Clean up temp file on failure
@@ -75,7 +102,24 @@ class ExportWorker(QThread):
             if self.temp_path and os.path.exists(self.temp_path):
                 os.remove(self.temp_path)
             self.finished.emit(False, f"Error during export: {str(e)}")
+        finally:
+            self.exporter = None
+    
+    @staticmethod
+    def _sync_file(path):
+        """Flush a written file's contents to disk."""
+        fd = os.open(path, os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
     
     def _on_page_progress(self, current, total):
-        """Handle page-level progress updates."""
-        self.page_progress.emit(current, total)
\ No newline at end of file
+        """Handle page-level progress updates, coalescing rapid ones."""
+        now = time.monotonic()
+        if (now - self._last_emit_ts >= self.PROGRESS_MIN_INTERVAL
+                or current == total
+                or current - self._last_emit_page >= self.PROGRESS_PAGE_STEP):
+            self._last_emit_ts = now
+            self._last_emit_page = current
+            self.page_progress.emit(current, total)
\ No newline at end of file
@@ -2,12 +2,37 @@
 Link extraction and handling for PDF pages.
 """
 
-from typing import List, Optional, Tuple
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
 
 import fitz
 
 from .models import LinkDestination, LinkInfo, LinkType
 
+logger = logging.getLogger(__name__)
+
+# Keep each link's raw get_links() dict on LinkInfo._raw_data. Only useful
+# for debugging, and the dicts (with their Rect objects) add up on large
+# documents, so they are dropped after parsing by default
+STORE_RAW_LINK_DATA = False
+
+# Mapping from fitz link kinds to our LinkType
+_LINK_TYPE_MAP = {
+    fitz.LINK_NONE: LinkType.UNKNOWN,
+    fitz.LINK_GOTO: LinkType.GOTO,
+    fitz.LINK_GOTOR: LinkType.GOTO_R,
+    fitz.LINK_URI: LinkType.URI,
+    fitz.LINK_LAUNCH: LinkType.LAUNCH,
+    fitz.LINK_NAMED: LinkType.NAMED,
+}
+
+# The same mapping as a tuple indexed by kind; the fitz.LINK_* kinds are
+# small ints, so parsing a link needs an index rather than a dict lookup
+_LINK_TYPES_BY_KIND: Tuple[LinkType, ...] = tuple(
+    _LINK_TYPE_MAP.get(kind, LinkType.UNKNOWN)
+    for kind in range(max(_LINK_TYPE_MAP) + 1)
+)
+
 
 class PageLinkLayer:
     """
@@ -16,36 +41,62 @@ class PageLinkLayer:
     Extracts and provides access to all interactive link regions.
     """
 
-    # Mapping from fitz link kinds to our LinkType
-    _LINK_TYPE_MAP = {
-        fitz.LINK_NONE: LinkType.UNKNOWN,
-        fitz.LINK_GOTO: LinkType.GOTO,
-        fitz.LINK_GOTOR: LinkType.GOTO_R,
-        fitz.LINK_URI: LinkType.URI,
-        fitz.LINK_LAUNCH: LinkType.LAUNCH,
-        fitz.LINK_NAMED: LinkType.NAMED,
-    }
-
-    def __init__(self, page: fitz.Page, doc: fitz.Document):
+    # Pages with fewer links than this are scanned linearly, which is
+    # cheaper than maintaining a spatial index for them
+    GRID_MIN_LINKS = 16
+
+    def __init__(
+        self,
+        page: fitz.Page,
+        doc: fitz.Document,
+        resolve_named: Optional[Callable[[str], Optional[dict]]] = None,
+    ):
         self.page = page
         self.doc = doc
+        # Resolves a destination name to a resolve_link() result; the
+        # reader's per-document cache, so names recurring across pages and
+        # layer rebuilds walk the name tree only once
+        self._resolve_named = resolve_named
         self.links: List[LinkInfo] = []
+        # Bounding boxes of self.links, stored apart from the LinkInfo
+        # objects so hit-tests scan plain tuples and touch a LinkInfo only
+        # for the links they return
+        self._bboxes: List[Tuple[float, float, float, float]] = []
+        # Grid cell -> indices into self.links, in link order; empty when
+        # the page has too few links to be worth indexing
+        self._link_grid: Dict[Tuple[int, int], List[int]] = {}
+        self._grid_size = 50  # Grid cell size for spatial lookup
+        self._grid_rows = 0
+        self._grid_cols = 0
+        # Links grouped by type, and internal (GOTO/NAMED) links, each in
+        # link order; filled during extraction so lookups need no scan
+        self._by_type: Dict[LinkType, List[LinkInfo]] = {}
+        self._internal_links: List[LinkInfo] = []
 
         self._extract_links()
+        self._build_spatial_index()
 
     def _extract_links(self):
         """Extract all links from the page."""
         try:
             raw_links = self.page.get_links()
         except Exception as e:
-            print(f"Failed to extract links: {e}")
+            logger.warning("Failed to extract links: %s", e)
             return
 
+        goto, named = LinkType.GOTO, LinkType.NAMED
         for link_data in raw_links:
             link_info = self._parse_link(link_data)
             if link_info:
                 self.links.append(link_info)
 
+                link_type = link_info.link_type
+                if link_type not in self._by_type:
+                    self._by_type[link_type] = []
+                self._by_type[link_type].append(link_info)
+                if link_type is goto or link_type is named:
+                    self._internal_links.append(link_info)
+
     def _parse_link(self, link_data: dict) -> Optional[LinkInfo]:
         """Parse a raw link dictionary into a LinkInfo object."""
         # Get bounding box
@@ -53,39 +104,43 @@ class PageLinkLayer:
         if from_rect is None:
             return None
 
-        # Handle both Rect objects and tuples
-        if hasattr(from_rect, "__iter__"):
-            bbox = tuple(from_rect)
-        else:
-            bbox = (from_rect.x0, from_rect.y0, from_rect.x1, from_rect.y1)
+        # get_links() always gives a fitz.Rect; read its corners directly
+        # rather than going through its Python-level __iter__
+        bbox = (from_rect.x0, from_rect.y0, from_rect.x1, from_rect.y1)
 
         # Get link type
         kind = link_data.get("kind", fitz.LINK_NONE)
-        link_type = self._LINK_TYPE_MAP.get(kind, LinkType.UNKNOWN)
+        if 0 <= kind < len(_LINK_TYPES_BY_KIND):
+            link_type = _LINK_TYPES_BY_KIND[kind]
+        else:
+            link_type = LinkType.UNKNOWN
 
         # Create base link info
-        link_info = LinkInfo(bbox=bbox, link_type=link_type, _raw_data=link_data)
-
-        # Parse type-specific data
-        if link_type == LinkType.GOTO:
+        link_info = LinkInfo(
+            bbox=bbox,
+            link_type=link_type,
+            _raw_data=link_data if STORE_RAW_LINK_DATA else None,
+        )
+
+        # Parse type-specific data (enum members are singletons, so
+        # identity checks are enough)
+        if link_type is LinkType.GOTO:
             link_info.destination = self._parse_goto_destination(link_data)
 
-        elif link_type == LinkType.GOTO_R:
+        elif link_type is LinkType.GOTO_R:
             link_info.file_path = link_data.get("file", "")
             link_info.destination = self._parse_goto_destination(link_data)
 
-        elif link_type == LinkType.URI:
+        elif link_type is LinkType.URI:
             link_info.uri = link_data.get("uri", "")
 
-        elif link_type == LinkType.LAUNCH:
+        elif link_type is LinkType.LAUNCH:
             link_info.file_path = link_data.get("file", "")
 
-        elif link_type == LinkType.NAMED:
+        elif link_type is LinkType.NAMED:
+            # Resolved on first hit in get_link_at_point; most links on a
+            # page are never pointed at
             link_info.named_dest = link_data.get("name", "")
-            # Try to resolve named destination
-            resolved = self._resolve_named_destination(link_info.named_dest)
-            if resolved:
-                link_info.destination = resolved
 
         return link_info
 
@@ -116,8 +171,10 @@ class PageLinkLayer:
             return None
 
         try:
-            # Use document's resolve_link method
-            dest = self.doc.resolve_link(f"#{name}")
+            if self._resolve_named is not None:
+                dest = self._resolve_named(name)
+            else:
+                dest = self.doc.resolve_link(f"#{name}")
             if dest and isinstance(dest, dict):
                 page_num = dest.get("page", -1)
                 if page_num >= 0:
@@ -131,15 +188,63 @@ class PageLinkLayer:
 
         return None
 
+    def _build_spatial_index(self):
+        """Build a grid-based spatial index for fast link lookup."""
+        self._bboxes = [link.bbox for link in self.links]
+        self._link_grid.clear()
+        if len(self.links) < self.GRID_MIN_LINKS:
+            return
+
+        # Cells are clamped to the page, so a bogus oversized link rect
+        # cannot blow up the grid; queries are clamped the same way
+        rect = self.page.rect
+        self._grid_cols = int(rect.width / self._grid_size)
+        self._grid_rows = int(rect.height / self._grid_size)
+
+        for index, (x0, y0, x1, y1) in enumerate(self._bboxes):
+            # Add link to all grid cells it overlaps
+            min_col = self._grid_cell(x0, self._grid_cols)
+            max_col = self._grid_cell(x1, self._grid_cols)
+            min_row = self._grid_cell(y0, self._grid_rows)
+            max_row = self._grid_cell(y1, self._grid_rows)
+
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    key = (row, col)
+                    if key not in self._link_grid:
+                        self._link_grid[key] = []
+                    self._link_grid[key].append(index)
+
+    def _grid_cell(self, value: float, limit: int) -> int:
+        """Grid cell index of a coordinate, clamped to the page's cells."""
+        return min(max(int(value / self._grid_size), 0), limit)
+
     def get_link_at_point(self, x: float, y: float) -> Optional[LinkInfo]:
         """
         Find the link at the given PDF coordinates.
 
         Returns the topmost link if multiple overlap.
         """
+        if self._link_grid:
+            # Only links sharing the point's grid cell can contain it
+            key = (
+                self._grid_cell(y, self._grid_rows),
+                self._grid_cell(x, self._grid_cols),
+            )
+            indices = self._link_grid.get(key, [])
+        else:
+            indices = range(len(self._bboxes))
+
         # Check in reverse order (later links are on top)
-        for link in reversed(self.links):
-            if link.contains_point(x, y):
+        bboxes = self._bboxes
+        for i in reversed(indices):
+            bx0, by0, bx1, by1 = bboxes[i]
+            if bx0 <= x <= bx1 and by0 <= y <= by1:
+                link = self.links[i]
+                if link.link_type is LinkType.NAMED and link.destination is None:
+                    link.destination = self._resolve_named_destination(
+                        link.named_dest
+                    )
                 return link
         return None
 
@@ -148,40 +253,55 @@ class PageLinkLayer:
     ) -> List[LinkInfo]:
         """Get all links that intersect with a rectangle."""
         x0, y0, x1, y1 = rect
-        result = []
+        result: List[LinkInfo] = []
+
+        if self._link_grid:
+            # Only links in the grid cells the rect covers can intersect
+            # it; gather them in link order
+            cells = set()
+            min_row = self._grid_cell(y0, self._grid_rows)
+            max_row = self._grid_cell(y1, self._grid_rows)
+            min_col = self._grid_cell(x0, self._grid_cols)
+            max_col = self._grid_cell(x1, self._grid_cols)
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    cells.update(self._link_grid.get((row, col), ()))
+            indices = sorted(cells)
+        else:
+            indices = range(len(self._bboxes))
 
-        for link in self.links:
+        append = result.append
+        bboxes = self._bboxes
+        links = self.links
+        for i in indices:
             # Check intersection
-            if (
-                link.bbox[0] <= x1
-                and link.bbox[2] >= x0
-                and link.bbox[1] <= y1
-                and link.bbox[3] >= y0
-            ):
-                result.append(link)
+            b = bboxes[i]
+            if b[0] <= x1 and b[2] >= x0 and b[1] <= y1 and b[3] >= y0:
+                append(links[i])
 
         return result
 
     def get_all_link_rects(self) -> List[Tuple[float, float, float, float]]:
-        """Get all link bounding boxes for visual indication."""
-        return [link.bbox for link in self.links]
+        """
+        Get all link bounding boxes for visual indication.
+
+        Returns the layer's own bbox list, built once with the layer and in
+        link order, so repaints do not rebuild it; treat it as read-only.
+        """
+        return self._bboxes
 
     def get_links_by_type(self, link_type: LinkType) -> List[LinkInfo]:
-        """Get all links of a specific type."""
-        return [link for link in self.links if link.link_type == link_type]
+        """Get all links of a specific type (shared; treat as read-only)."""
+        return self._by_type.get(link_type, [])
 
     @property
     def internal_links(self) -> List[LinkInfo]:
-        """Get all internal navigation links."""
-        return [
-            link
-            for link in self.links
-            if link.link_type in (LinkType.GOTO, LinkType.NAMED)
-        ]
+        """Get all internal navigation links (shared; treat as read-only)."""
+        return self._internal_links
 
     @property
     def external_links(self) -> List[LinkInfo]:
-        """Get all external URL links."""
+        """Get all external URL links (shared; treat as read-only)."""
         return self.get_links_by_type(LinkType.URI)
 
     def __len__(self) -> int:
@@ -33,7 +33,7 @@ class InteractionType(Enum):
 # ==============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkDestination:
     """Destination information for internal links."""
 
@@ -43,7 +43,7 @@ class LinkDestination:
     zoom: Optional[float] = None  # Zoom level (if specified)
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkInfo:
     """Represents a clickable link in the PDF."""
 
@@ -62,12 +62,13 @@ class LinkInfo:
     # For file links
     file_path: Optional[str] = None
 
-    # Original link data for debugging
+    # Original link data for debugging (see link_layer.STORE_RAW_LINK_DATA)
     _raw_data: Optional[dict] = None
 
     def contains_point(self, x: float, y: float) -> bool:
         """Check if a point is within this link's bounds."""
-        return self.bbox[0] <= x <= self.bbox[2] and self.bbox[1] <= y <= self.bbox[3]
+        x0, y0, x1, y1 = self.bbox
+        return x0 <= x <= x1 and y0 <= y <= y1
 
     @property
     def display_text(self) -> str:
@@ -90,7 +91,7 @@ class LinkInfo:
 # ==============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionResult:
     """Result of checking what's at a point."""
 
@@ -107,7 +108,7 @@ class InteractionResult:
 # ==============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterInfo:
     """Represents a single character with its position and metadata."""
 
@@ -129,7 +130,7 @@ class CharacterInfo:
         return self.bbox[0] <= x <= self.bbox[2] and self.bbox[1] <= y <= self.bbox[3]
 
 
-@dataclass
+@dataclass(slots=True)
 class SpanInfo:
     """A span of text with consistent formatting."""
 
@@ -145,7 +146,7 @@ class SpanInfo:
         return "".join(c.char for c in self.characters)
 
 
-@dataclass
+@dataclass(slots=True)
 class LineInfo:
     """A line of text containing multiple spans."""
 
@@ -166,7 +167,7 @@ class LineInfo:
         return chars
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockInfo:
     """A block of text (paragraph or text region)."""
 
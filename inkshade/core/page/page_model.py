@@ -2,7 +2,7 @@
 Unified page model combining rendering, text, and links.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import fitz
 from PyQt5.QtGui import QImage, QPixmap
@@ -25,9 +25,15 @@ class PageModel:
     Uses lazy loading for text and link layers to optimize memory.
     """
 
-    def __init__(self, doc: fitz.Document, page_index: int):
+    def __init__(
+        self,
+        doc: fitz.Document,
+        page_index: int,
+        resolve_named: Optional[Callable[[str], Optional[dict]]] = None,
+    ):
         self._doc = doc
         self.page_index = page_index
+        self._resolve_named = resolve_named
         self._page: Optional[fitz.Page] = None
 
         # Lazy-loaded layers
@@ -94,10 +100,16 @@ class PageModel:
         """Get link layer, creating if necessary."""
         if self._link_layer is None:
             try:
-                self._link_layer = PageLinkLayer(self.page, self._doc)
+                self._link_layer = PageLinkLayer(
+                    self.page, self._doc, self._resolve_named
+                )
             except Exception as e:
                 self._link_layer = PageLinkLayer.__new__(PageLinkLayer)
                 self._link_layer.links = []
+                self._link_layer._bboxes = []
+                self._link_layer._link_grid = {}
+                self._link_layer._by_type = {}
+                self._link_layer._internal_links = []
         return self._link_layer
 
     def render_pixmap(
@@ -124,15 +136,18 @@ class PageModel:
         mat = fitz.Matrix(zoom, zoom)
         pix = self.page.get_pixmap(matrix=mat, alpha=False)
 
-        # Convert to QImage
+        # Apply dark mode, inverting MuPDF's buffer in place so Qt never
+        # has to detach and copy the image to invert it
+        if dark_mode:
+            pix.invert_irect()
+
+        # Convert to QImage, wrapping MuPDF's sample buffer in place rather
+        # than copying it out through pix.samples; pix outlives the QPixmap
+        # conversion below
         img = QImage(
-            pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888
+            pix.samples_ptr, pix.width, pix.height, pix.stride, QImage.Format_RGB888
         )
 
-        # Apply dark mode
-        if dark_mode:
-            img.invertPixels()
-
         # Convert to QPixmap
         pixmap = QPixmap.fromImage(img)
 
@@ -17,6 +17,7 @@ from PyQt5.QtGui import (
 from PyQt5.QtWidgets import QApplication, QLabel, QToolTip
 
 from inkshade.core.annotations import AnnotationType
+from inkshade.core.annotations.models import POINT_DECIMALS
 from inkshade.core.page.link_layer import LinkInfo, LinkType
 from inkshade.core.page.page_model import InteractionType, PageModel
 from inkshade.core.page.text_layer import CharacterInfo
@@ -288,23 +289,29 @@ class InteractivePageLabel(QLabel):
 
     # Drawing methods
 
+    def _to_drawing_point(self, pos) -> Tuple[float, float]:
+        """Convert widget coordinates to a PDF point at stored precision."""
+        pdf_x, pdf_y = self._to_pdf_coords(pos)
+        return round(pdf_x, POINT_DECIMALS), round(pdf_y, POINT_DECIMALS)
+
     def _start_drawing(self, pos):
         """Start a drawing operation."""
         self._is_drawing = True
-        pdf_x, pdf_y = self._to_pdf_coords(pos)
-        self._drawing_points = [(pdf_x, pdf_y)]
+        self._drawing_points = [self._to_drawing_point(pos)]
         self.update()
 
     def _continue_drawing(self, pos):
         """Continue drawing operation."""
-        pdf_x, pdf_y = self._to_pdf_coords(pos)
-        self._drawing_points.append((pdf_x, pdf_y))
+        point = self._to_drawing_point(pos)
+        if point == self._drawing_points[-1]:
+            # Moves within the stored precision add nothing to the stroke
+            return
+        self._drawing_points.append(point)
         self.update()
 
     def _finish_drawing(self, pos):
         """Finish drawing and create annotation."""
-        pdf_x, pdf_y = self._to_pdf_coords(pos)
-        self._drawing_points.append((pdf_x, pdf_y))
+        self._drawing_points.append(self._to_drawing_point(pos))
         self._is_drawing = False
 
         if len(self._drawing_points) >= 2:
@@ -354,7 +361,7 @@ class InteractivePageLabel(QLabel):
             self._paint_selection(painter)
             self._paint_search_highlights(painter)
             self._paint_link_hover(painter)
-            self._paint_annotations(painter)
+            self._paint_annotations(painter, QRectF(event.rect()))
 
             if self._is_drawing and self._drawing_points:
                 self._paint_drawing_preview(painter)
@@ -466,23 +473,75 @@ class InteractivePageLabel(QLabel):
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRect(screen_rect)
 
-    def _paint_annotations(self, painter: QPainter):
-        """Paint annotations on this page."""
+    def _paint_annotations(self, painter: QPainter, clip: QRectF):
+        """Paint the annotations on this page that intersect clip."""
+        # Cull against the exposed area in PDF coordinates, using the boxes
+        # cached on each annotation. Scrolling only exposes thin strips, so
+        # most annotations are skipped without touching their geometry.
+        zoom = self.zoom
+        margin = 2.0 / zoom  # Underline pen width
+        left = clip.left() / zoom - margin
+        top = clip.top() / zoom - margin
+        right = clip.right() / zoom + margin
+        bottom = clip.bottom() / zoom + margin
+
         for ann in self.annotations:
-            if ann.annotation_type == AnnotationType.HIGHLIGHT:
-                self._paint_highlight(painter, ann)
-            elif ann.annotation_type == AnnotationType.UNDERLINE:
-                self._paint_underline(painter, ann)
-            elif ann.annotation_type == AnnotationType.FREEHAND:
+            bounds = ann.bounds
+            if bounds is None:
+                continue
+
+            if ann.annotation_type == AnnotationType.FREEHAND:
+                pad = ann.stroke_width / zoom
+                if (
+                    bounds[0] - pad > right
+                    or bounds[2] + pad < left
+                    or bounds[1] - pad > bottom
+                    or bounds[3] + pad < top
+                ):
+                    continue
                 self._paint_freehand(painter, ann)
+            elif ann.annotation_type in (
+                AnnotationType.HIGHLIGHT,
+                AnnotationType.UNDERLINE,
+            ):
+                if (
+                    bounds[0] > right
+                    or bounds[2] < left
+                    or bounds[1] > bottom
+                    or bounds[3] < top
+                ):
+                    continue
+                if (
+                    left <= bounds[0]
+                    and bounds[2] <= right
+                    and top <= bounds[1]
+                    and bounds[3] <= bottom
+                ):
+                    # Entirely exposed, as on a full repaint
+                    quads = ann.quads
+                else:
+                    quads = [
+                        quad
+                        for quad, box in zip(ann.quads, ann.quad_bounds)
+                        if box[0] <= right
+                        and box[2] >= left
+                        and box[1] <= bottom
+                        and box[3] >= top
+                    ]
+                    if not quads:
+                        continue
+                if ann.annotation_type == AnnotationType.HIGHLIGHT:
+                    self._paint_highlight(painter, ann, quads)
+                else:
+                    self._paint_underline(painter, ann, quads)
 
-    def _paint_highlight(self, painter: QPainter, ann):
-        """Paint a highlight annotation."""
+    def _paint_highlight(self, painter: QPainter, ann, quads):
+        """Paint the given quads of a highlight annotation."""
         color = QColor(ann.color[0], ann.color[1], ann.color[2], 100)
         painter.setBrush(QBrush(color))
         painter.setPen(Qt.PenStyle.NoPen)
 
-        for quad in ann.quads:
+        for quad in quads:
             rect = QRectF(
                 quad[0] * self.zoom,
                 quad[1] * self.zoom,
@@ -491,12 +550,12 @@ class InteractivePageLabel(QLabel):
             )
             painter.drawRect(rect)
 
-    def _paint_underline(self, painter: QPainter, ann):
-        """Paint an underline annotation."""
+    def _paint_underline(self, painter: QPainter, ann, quads):
+        """Paint the given quads of an underline annotation."""
         color = QColor(ann.color[0], ann.color[1], ann.color[2])
         painter.setPen(QPen(color, 2))
 
-        for quad in ann.quads:
+        for quad in quads:
             y = quad[5] * self.zoom
             painter.drawLine(
                 int(quad[0] * self.zoom), int(y), int(quad[2] * self.zoom), int(y)
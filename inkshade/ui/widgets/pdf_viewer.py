@@ -2,6 +2,7 @@
 PDF viewer widget - Updated to use new page architecture.
 """
 
+import logging
 from typing import Dict, List, Optional
 
 from PyQt5.QtCore import Qt, QTimer
@@ -19,6 +20,8 @@ from inkshade.core.search import SearchHighlight
 from inkshade.core.selection import SelectionManager
 from inkshade.ui.widgets.page_label import InteractivePageLabel
 
+logger = logging.getLogger(__name__)
+
 
 class PDFViewer:
     """
@@ -168,6 +171,7 @@ class PDFViewer:
             )
             self.page_container.setMinimumHeight(total_height)
             self.main_window.page_height = self.page_height
+            self.main_window.view_controller.set_page_height(self.page_height)
 
     def set_zoom(self, new_zoom: float):
         """Updates the zoom factor."""
@@ -220,6 +224,7 @@ class PDFViewer:
         if actual_page_height:
             self.page_height = actual_page_height
             self.main_window.page_height = actual_page_height
+            self.main_window.view_controller.set_page_height(actual_page_height)
 
             # Update container height
             if self.pdf_reader_core.total_pages > 0:
@@ -317,9 +322,12 @@ class PDFViewer:
                     if self.page_height is None:
                         return
 
-            total_pages = self.pdf_reader_core.total_pages
-            start_index = max(0, current_page_index - self.page_buffer)
-            end_index = min(total_pages - 1, current_page_index + self.page_buffer)
+            # Skewed towards the direction of travel while scrolling
+            start_index, end_index = (
+                self.main_window.view_controller.get_visible_page_range(
+                    self.page_buffer, current_page_index
+                )
+            )
 
             # Find and unload pages outside buffer
             pages_to_unload = [
@@ -350,7 +358,11 @@ class PDFViewer:
     def _load_and_display_page(self, idx: int):
         """Render and display a single page."""
         if idx not in self.page_models:
-            self.page_models[idx] = PageModel(self.pdf_reader_core.doc, idx)
+            self.page_models[idx] = PageModel(
+                self.pdf_reader_core.doc,
+                idx,
+                self.pdf_reader_core.resolve_named_dest,
+            )
 
         page_model = self.page_models[idx]
         QApplication.processEvents()
@@ -409,6 +421,7 @@ class PDFViewer:
                 )
                 self.page_container.setMinimumHeight(total_height)
                 self.main_window.page_height = self.page_height
+                self.main_window.view_controller.set_page_height(self.page_height)
 
         container_width = self.page_container.width()
         pixmap = label.pixmap()
@@ -431,16 +444,9 @@ class PDFViewer:
         if self.page_height is None or self.page_height == 0:
             return 0
 
-        vsb = self.scroll_area.verticalScrollBar()
-        scroll_val = vsb.value()
-        viewport_height = self.scroll_area.viewport().height()
-        H = self.page_height + self.page_spacing
-
-        current_page = round(
-            (scroll_val + viewport_height / 2 - self.page_height / 2) / H
-        )
-        current_page = max(0, min(self.pdf_reader_core.total_pages - 1, current_page))
-        return current_page
+        # Same calculation as the page_changed signal, so the page box
+        # never flips between two answers near a page boundary
+        return self.main_window.view_controller.get_current_page()
 
     def get_scroll_info(self):
         """Returns current page index and offset for zoom operations."""
@@ -488,7 +494,7 @@ class PDFViewer:
                 else:
                     target_y = page_start_y
             except Exception as e:
-                print(f"Jump calculation failed: {e}")
+                logger.warning("Jump calculation failed: %s", e)
                 target_y = page_start_y
         else:
             target_y = page_start_y
@@ -359,6 +359,9 @@ class MainWindow(QMainWindow):
         self.annotation_controller.annotations_changed.connect(
             self._on_annotations_changed
         )
+        self.annotation_controller.annotations_loaded.connect(
+            self._on_annotations_loaded
+        )
 
         # TOC connections
         self.toc_widget.toc_link_clicked.connect(self._handle_toc_click)
@@ -430,11 +433,20 @@ class MainWindow(QMainWindow):
 
     # Document Management Methods
 
-    def load_pdf(self, file_path: str):
-        """Load a PDF file."""
-        success, total_pages = self.pdf_reader.load_pdf(file_path)
+    def load_pdf(self, file_path: str, doc=None):
+        """
+        Load a PDF file.
+
+        Args:
+            file_path: Path to the PDF file
+            doc: Optional fitz.Document already opened for file_path
+        """
+        success, total_pages = self.pdf_reader.load_pdf(file_path, doc)
 
         if not success:
+            QMessageBox.critical(
+                self, "Error", f"Error loading PDF: {self.pdf_reader.last_error}"
+            )
             return
 
         # Update search engine
@@ -445,14 +457,8 @@ class MainWindow(QMainWindow):
         self.view_controller.set_document_info(total_pages)
         self.page_height = None  # Reset page height
 
-        # Load annotations
-        annotation_count = self.annotation_controller.load_annotations(file_path)
-        if annotation_count > 0:
-            QMessageBox.information(
-                self,
-                "Annotations Loaded",
-                f"Loaded {annotation_count} existing annotation(s) from previous session.",
-            )
+        # Load annotations (in the background; see _on_annotations_loaded)
+        self.annotation_controller.load_annotations_async(file_path)
 
         # Update UI
         self.current_file_path = file_path
@@ -461,8 +467,9 @@ class MainWindow(QMainWindow):
         self.page_edit.setText("1")
         self.page_edit.setValidator(QIntValidator(1, total_pages, self))
 
-        # Load TOC
-        self.load_toc_data()
+        # Load TOC from the event loop, so processing a large TOC does not
+        # hold up setting up the first pages below
+        QTimer.singleShot(0, self.load_toc_data)
 
         # Clear and update pages
         self.page_manager.clear_all()
@@ -1042,15 +1049,13 @@ class MainWindow(QMainWindow):
 
     def undo_annotation(self):
         """Undo the last annotation."""
-        if self.annotation_controller.undo():
-            self._update_all_page_annotations()  # Update in place, no refresh
-            self._update_undo_redo_buttons()
+        # annotations_changed refreshes the pages the action touched
+        self.annotation_controller.undo()
 
     def redo_annotation(self):
         """Redo the last undone annotation."""
-        if self.annotation_controller.redo():
-            self._update_all_page_annotations()  # Update in place, no refresh
-            self._update_undo_redo_buttons()
+        # annotations_changed refreshes the pages the action touched
+        self.annotation_controller.redo()
 
     def _update_undo_redo_buttons(self):
         """Update undo/redo button states."""
@@ -1184,10 +1189,24 @@ class MainWindow(QMainWindow):
         zoom_percent = int((zoom_level / self.base_zoom) * 100)
         self.zoom_lineedit.setText(str(zoom_percent))
 
+    def _on_annotations_loaded(self, annotation_count: int):
+        """Report annotations restored from a previous session."""
+        if annotation_count > 0:
+            QMessageBox.information(
+                self,
+                "Annotations Loaded",
+                f"Loaded {annotation_count} existing annotation(s) from previous session.",
+            )
+
     def _on_annotations_changed(self):
         """Handle annotation changes."""
-        # Update all visible pages' annotations in place
-        self._update_all_page_annotations()
+        # Update the affected visible pages' annotations in place
+        changed_pages = self.annotation_manager.take_changed_pages()
+        if changed_pages is None:
+            self._update_all_page_annotations()
+        else:
+            for page_index in changed_pages:
+                self._update_page_annotations(page_index)
         self._update_undo_redo_buttons()
 
     def _update_page_annotations(self, page_index: int):
@@ -1259,6 +1278,9 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):  # type: ignore[override]
         """Handle window close with one-time warning per session."""
+        # Put any debounced auto-save on disk before the window goes away
+        self.annotation_manager.flush_pending_save()
+
         if self.annotation_manager.has_unsaved_changes:
             # Use warning manager for potentially one-time warning
             result = warning_manager.show_save_discard_cancel(
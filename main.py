@@ -1,4 +1,5 @@
 import sys, os
+import logging
 from PyQt5.QtWidgets import QApplication
 from inkshade.ui.windows import MainWindow
 
@@ -7,6 +8,10 @@ def main():
     Main function to run the PDF reader application.
     It checks for a file path passed as a command-line argument.
     """
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(levelname)s %(name)s: %(message)s'
+    )
     app = QApplication(sys.argv)
     
     file_path = None